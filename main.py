@@ -1,5 +1,13 @@
+import argparse
 from src.ui.ui import WaspSimUI
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = "ARM Simulation Tool")
+    parser.add_argument("--replay", help = "Trajectory File to Play Back (see src.model.trajectory)")
+    parser.add_argument("--profile", metavar = "FILE", help = "Profile Each Run & Write the Report Here (.json or Text)")
+    args = parser.parse_args()
     ui = WaspSimUI()
+    ui.profile_path = args.profile
+    if args.replay:
+        ui.start_replay(args.replay)
     ui.run()
\ No newline at end of file
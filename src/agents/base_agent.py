@@ -1,6 +1,5 @@
 from mesa import Agent
-from src.utils.helpers import hex_distance
-import random
+from src.model.agent_state import ROLES, ROLE_CODES
 
 class WaspAgent(Agent):
     """Base for ALl Wasp Agents (Foragers, Primary Receivers, Secondary Feeders)."""
@@ -8,67 +7,84 @@ class WaspAgent(Agent):
         object.__init__(self) 
         self.unique_id = unique_id
         self.model = model
+        self.arrays = model.agent_state
+        self.idx = self.arrays.register()
         self.pos = None 
         self.agent_type = "wasp"
         self.load = 0.0
         self.max_hunger = 10.0 
         self.hunger = 0.0 
 
-    # Increase Agent Hunger Over Time.
-    def decay_hunger(self, dt):
-        increase_rate_per_sec = 0.01
-        self.hunger = min(self.max_hunger, self.hunger + increase_rate_per_sec * dt)
-    
-    # Returns List of Valid Adj. Hex CoOrds within Boudnaries of Nest Grid.
+    # Position, Role, Load & Hunger Live in the Model's AgentState Arrays (Agent is a Thin View).
+    @property
+    def pos(self):
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        self._pos = value
+        if value is not None:
+            self.arrays.q[self.idx], self.arrays.r[self.idx] = value
+
+    @property
+    def agent_type(self):
+        return ROLES[self.arrays.role[self.idx]]
+
+    @agent_type.setter
+    def agent_type(self, value):
+        self.arrays.role[self.idx] = ROLE_CODES[value]
+
+    # Load Setter Also Keeps the Model's Partner Index & Metrics Current on Every Transfer.
+    @property
+    def load(self):
+        return float(self.arrays.load[self.idx])
+
+    @load.setter
+    def load(self, value):
+        old = float(self.arrays.load[self.idx])
+        self.arrays.load[self.idx] = value
+        index = getattr(self.model, "agent_index", None)
+        if index is not None:
+            index.update(self)
+        metrics = getattr(self.model, "metrics", None)
+        if metrics is not None:
+            metrics.on_load(self, old, value)
+
+    @property
+    def hunger(self):
+        return self.arrays.hunger_of(self.idx)
+
+    @hunger.setter
+    def hunger(self, value):
+        self.arrays.set_hunger(self.idx, value)
+
+    @property
+    def max_hunger(self):
+        return float(self.arrays.max_hunger[self.idx])
+
+    @max_hunger.setter
+    def max_hunger(self, value):
+        self.arrays.max_hunger[self.idx] = value
+
+    # Returns List of Valid Adj. Hex CoOrds within Boudnaries of Nest Grid (Precomputed Table, Read-Only).
     def get_neighbors(self, include_center = False):
-        neighbors = []
-        directions = [(1,0), (1,-1), (0,-1), (-1,0), (-1,1), (0,1)]
-        
-        for d in directions:
-            n_pos = (self.pos[0] + d[0], self.pos[1] + d[1])
-            if n_pos in self.model.ui.grid.cells:
-                neighbors.append(n_pos)
-            
+        neighbors = self.model.nest_grid.neighbors.get(self.pos, [])
         if include_center:
-            neighbors.append(self.pos)
+            return neighbors + [self.pos]
         return neighbors
 
-    # Hex CoOrds -> MESA Positive Grid CoOrds Converter.
-    def _shift_pos(self, pos):
-        return (pos[0] + self.model.OFFSET, pos[1] + self.model.OFFSET)
-
     # Agent Movement Handler.
     def move_to_pos(self, pos):
         if pos == self.pos: return
-        new_shifted_pos = self.model._shift_pos(pos)
-        current_shifted_pos = self.model._shift_pos(self.pos)
-        original_pos = self.pos
-        self.pos = current_shifted_pos 
-        self.model.grid.move_agent(self, new_shifted_pos)
-        self.pos = pos
+        old_pos = self.pos
+        self.model.grid.move_agent(self, pos)
+        self.model.agent_index.update(self)
+        self.model.metrics.on_move(self, old_pos, pos)
 
-    # Moves Agent 1 Step Towards a Hex Position.
+    # Moves Agent 1 Step Towards a Hex Position (Foragers & Receivers may Cross Border Cells).
     def move_toward(self, target):
         if not target: return
-        
-        candidates = self.get_neighbors()
-        if not candidates: return
-
-        best = self.pos
-        best_dist = hex_distance(self.pos, target)
-
-        for n_pos in candidates:
-            dist = hex_distance(n_pos, target)
-            if dist < best_dist:
-                cell = self.model.ui.grid.cells.get(n_pos) 
-                
-                is_exchange_agent = self.agent_type in ["forager", "primary_receiver"]
-                if cell and (cell.stage != "border" or is_exchange_agent):
-                    best_dist = dist
-                    best = n_pos
-                elif cell and n_pos == target: 
-                    best_dist = dist
-                    best = n_pos
-        
+        can_cross_border = self.agent_type in ["forager", "primary_receiver"]
+        best = self.model.navigation.next_step(self.pos, target, can_cross_border)
         if best != self.pos:
             self.move_to_pos(best)
\ No newline at end of file
@@ -12,16 +12,16 @@ class PrimaryReceiver(WaspAgent):
         
         # Distribute Food to Secondary Feeders
         if self.load > 0.1:
-            feeders = [a for a in self.model.ui_agents if a.agent_type == "secondary_feeder" and a.load < 2.0]
-            if feeders:
-                target = min(feeders, key = lambda f: hex_distance(self.pos, f.pos))
+            target = self.model.agent_index.nearest("feeder_open", self.pos)
+            if target:
                 
                 dist_to_target = hex_distance(self.pos, target.pos)
                 if dist_to_target == 0: 
                     give = min(1.0, self.load)
                     self.load -= give
                     target.load += give
-                    self.model.start_new_bout(self.model.ui.last_realtime_check)
+                    self.model.count("transfer.receiver_to_feeder")
+                    self.model.start_new_bout(self.model.now_ms)
                     return
                 
                 self.move_toward(target.pos)
@@ -30,20 +30,18 @@ class PrimaryReceiver(WaspAgent):
         # Get Food from Foragers
         if self.load < 5.0:
             
-            # Proactive Exchange Check
-            for n_pos in self.get_neighbors(include_center=True):
-                shifted_pos = self.model._shift_pos(n_pos)
-                agents_here = self.model.grid.get_cell_list_contents(shifted_pos)
-                for agent in agents_here:
+            # Proactive Exchange Check (Occupants are Only Scanned when a Loaded Forager is Adjacent).
+            if self.model.agent_index.any_within("forager_loaded", self.pos, 1):
+                for agent in self.model.grid.agents_in(self.get_neighbors(include_center=True)):
                     if agent.agent_type == "forager" and agent.load > 0.1:
                         give = min(0.5, agent.load)
                         self.load += give
                         agent.load -= give
+                        self.model.count("transfer.forager_to_receiver")
                         return
 
             # Movement Logic
-            foragers = [a for a in self.model.ui_agents if a.agent_type == "forager" and a.load > 0.1]
-            if foragers:
-                target = min(foragers, key=lambda f: hex_distance(self.pos, f.pos))
+            target = self.model.agent_index.nearest("forager_loaded", self.pos)
+            if target:
                 self.move_toward(target.pos)
                 return
\ No newline at end of file
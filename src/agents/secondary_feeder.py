@@ -12,19 +12,19 @@ class SecondaryFeeder(WaspAgent):
         
         # Feed Larvae
         if self.load > 0.1:
-            larvae = [
-                (p, c) for p, c in self.model.ui.grid.cells.items() 
-                if c.type == "larva" and c.hunger > 0.1
-            ]
-            if larvae:
-                target_pos, target_cell = max(larvae, key = lambda x: x[1].hunger)
+            target = self.model.nest_grid.hungriest_larva()
+            if target:
+                target_pos, target_cell = target
                 dist_to_target = hex_distance(self.pos, target_pos)
                 if dist_to_target <= 1:
                     fed = target_cell.feed(min(0.5, self.load)) 
                     self.load -= fed
                     if fed > 0:
                         self.model.current_bout_larvae_fed += fed 
+                        self.model.total_larvae_fed += fed
                         self.model.food_in_system -= fed
+                        self.model.log_event("larva_feed", target_pos, fed)
+                        self.model.count("transfer.feeder_to_larva")
                     return
                 
                 self.move_toward(target_pos)
@@ -32,14 +32,14 @@ class SecondaryFeeder(WaspAgent):
 
         # Get Food Units from Primary Receiver
         if self.load < 0.1:
-            receivers = [a for a in self.model.ui_agents if a.agent_type == "primary_receiver" and a.load > 0.1]
-            if receivers:
-                target = min(receivers, key = lambda a: hex_distance(self.pos, a.pos))
+            target = self.model.agent_index.nearest("receiver_loaded", self.pos)
+            if target:
                 dist_to_target = hex_distance(self.pos, target.pos)
                 if dist_to_target <= 1:
                     give = min(1.0, target.load) 
                     self.load += give
                     target.load -= give
+                    self.model.count("transfer.receiver_to_feeder")
                     return
                 
                 self.move_toward(target.pos)
@@ -0,0 +1,127 @@
+import itertools
+import numpy as np
+from src.utils.helpers import hex_argmin, hex_distance
+
+# Partner Filters Queried by Agent Steps: Name -> (Role, Load Predicate).
+PARTNER_FILTERS = {
+    "receiver_open": ("primary_receiver", lambda load: load < 5.0),
+    "receiver_loaded": ("primary_receiver", lambda load: load > 0.1),
+    "forager_loaded": ("forager", lambda load: load > 0.1),
+    "feeder_open": ("secondary_feeder", lambda load: load < 2.0),
+}
+
+# Blocks Exactly c Steps from (bq, br) in Block Space (Square Ring; c = 0 -> the Block Itself).
+def block_ring(bq, br, c):
+    if c == 0:
+        return [(bq, br)]
+    edges = [(bq + i, br + s) for s in (-c, c) for i in range(-c, c + 1)]
+    return edges + [(bq + s, br + j) for s in (-c, c) for j in range(-c + 1, c)]
+
+class AgentIndex:
+    """Agents per Partner Filter, Bucketed into Coarse Axial Blocks (Kept Current on Moves & Load Changes)."""
+    # Below this Many Candidates a Python Scan Beats Gathering their Rows for 1 NumPy Pass.
+    LINEAR_SCAN_LIMIT = 24
+    # Block Edge in Hexes -> an Agent at (q, r) is Filed under (q // BLOCK, r // BLOCK).
+    BLOCK = 2
+
+    def __init__(self):
+        self.members = {name: {} for name in PARTNER_FILTERS}
+        self.blocks = {name: {} for name in PARTNER_FILTERS}
+        self.agents = []
+        self.state = None
+        # Set by WaspModel.enable_profiling -> Counts Scans per Filter.
+        self.profiler = None
+
+    def block_of(self, pos):
+        return pos[0] // self.BLOCK, pos[1] // self.BLOCK
+
+    # Bulk Build from AgentState Masks (1 Vectorized Pass per Filter); agents[i] Must Own Row i.
+    def rebuild(self, agents, state):
+        self.members = {name: {} for name in PARTNER_FILTERS}
+        self.blocks = {name: {} for name in PARTNER_FILTERS}
+        self.agents = agents
+        self.state = state
+        for name in PARTNER_FILTERS:
+            members, blocks = self.members[name], self.blocks[name]
+            for i in state.eligible(name).nonzero()[0]:
+                agent = agents[i]
+                members[agent] = agent.pos
+                blocks.setdefault(self.block_of(agent.pos), set()).add(agent)
+
+    # Re-File Agent after a Move or Load Change (Block Sets Only Change when the Agent Crosses a Block Edge).
+    def update(self, agent):
+        pos = agent.pos
+        if pos is None: return
+        for name, (role, pred) in PARTNER_FILTERS.items():
+            if agent.agent_type == role and pred(agent.load):
+                members = self.members[name]
+                old = members.get(agent)
+                members[agent] = pos
+                block = self.block_of(pos)
+                if old is None or self.block_of(old) != block:
+                    if old is not None:
+                        self._unfile(name, agent, old)
+                    self.blocks[name].setdefault(block, set()).add(agent)
+            else:
+                self._discard(name, agent)
+
+    def _discard(self, name, agent):
+        old = self.members[name].pop(agent, None)
+        if old is not None:
+            self._unfile(name, agent, old)
+
+    def _unfile(self, name, agent, pos):
+        blocks = self.blocks[name]
+        block = self.block_of(pos)
+        bucket = blocks[block]
+        bucket.discard(agent)
+        if not bucket:
+            del blocks[block]
+
+    # Closest of Some Candidates as ((Distance, unique_id), Agent); Many Candidates -> 1 hex_argmin over their Rows.
+    def _closest(self, pos, found):
+        if len(found) <= self.LINEAR_SCAN_LIMIT:
+            agent = min(found, key = lambda a: (hex_distance(pos, a.pos), a.unique_id))
+        else:
+            # Sorted Rows are unique_id Order -> the First Nearest Row is the Tie-Break Winner.
+            rows = np.sort(np.fromiter((a.idx for a in found), dtype = np.int64, count = len(found)))
+            agent = self.agents[rows[hex_argmin(pos, self.state.q[rows], self.state.r[rows])]]
+        return (hex_distance(pos, agent.pos), agent.unique_id), agent
+
+    # Nearest Agent Passing Filter (Ties -> Lowest unique_id), or None.
+    # Blocks c Rings Out Hold No Hex Closer than (c - 1) * BLOCK + 1 -> Stop once the Best Beats the Next Ring.
+    def nearest(self, name, pos):
+        if self.profiler is not None:
+            self.profiler.count(f"nearest.{name}")
+        members = self.members[name]
+        if not members: return None
+        if len(members) <= self.LINEAR_SCAN_LIMIT:
+            return min(members, key = lambda a: (hex_distance(pos, members[a]), a.unique_id))
+
+        blocks = self.blocks[name]
+        bq, br = self.block_of(pos)
+        best = None
+        for c in itertools.count():
+            # More Blocks Probed than there are Members w/o a Hit (Sparse Filter) -> 1 Pass over All Members is Cheaper.
+            if best is None and (2 * c + 1) ** 2 > len(members):
+                return self._closest(pos, list(members))[1]
+            found = [a for block in block_ring(bq, br, c) for a in blocks.get(block, ())]
+            if found:
+                cand = self._closest(pos, found)
+                if best is None or cand[0] < best[0]:
+                    best = cand
+            if best is not None and best[0][0] <= c * self.BLOCK:
+                return best[1]
+
+    # True if Any Agent Passing Filter is within radius of pos (Cheap Pre-Check before Scanning Cell Occupants).
+    def any_within(self, name, pos, radius):
+        members = self.members[name]
+        if len(members) <= self.LINEAR_SCAN_LIMIT:
+            return any(hex_distance(pos, p) <= radius for p in members.values())
+        blocks, B = self.blocks[name], self.BLOCK
+        for bq in range((pos[0] - radius) // B, (pos[0] + radius) // B + 1):
+            for br in range((pos[1] - radius) // B, (pos[1] + radius) // B + 1):
+                for a in blocks.get((bq, br), ()):
+                    if hex_distance(pos, members[a]) <= radius:
+                        return True
+        return False
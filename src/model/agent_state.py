@@ -0,0 +1,77 @@
+import numpy as np
+from src.model.agent_index import PARTNER_FILTERS
+
+# Agent Role Name <-> Compact Role Code.
+ROLES = ["wasp", "forager", "primary_receiver", "secondary_feeder"]
+ROLE_CODES = {role: i for i, role in enumerate(ROLES)}
+
+# Agent Hunger Growth (Units per Second).
+AGENT_HUNGER_DECAY_PER_SEC = 0.01
+
+# Agent Hunger Gained over elapsed_ms (Same Integer-ms Form as Larvae, see hunger_index.hunger_growth).
+def agent_hunger_growth(elapsed_ms):
+    return AGENT_HUNGER_DECAY_PER_SEC * elapsed_ms / 1000
+
+class AgentState:
+    """Model-Owned Compact Arrays of Agent Position, Load, Hunger & Role (Agents are Thin Views)."""
+    def __init__(self, capacity = 64):
+        self.n = 0
+        # Hunger Clock (Simulated ms): hunger Holds the Value at its Last Write, hunger_time When that Was.
+        self.now_ms = 0
+        self.q = np.zeros(capacity, dtype = np.int32)
+        self.r = np.zeros(capacity, dtype = np.int32)
+        self.role = np.zeros(capacity, dtype = np.int8)
+        self.load = np.zeros(capacity, dtype = np.float64)
+        self.hunger = np.zeros(capacity, dtype = np.float64)
+        self.hunger_time = np.zeros(capacity, dtype = np.int64)
+        self.max_hunger = np.zeros(capacity, dtype = np.float64)
+
+    # Reserve a Row for a New Agent & Return its Index.
+    def register(self):
+        if self.n == len(self.load):
+            self._grow()
+        i = self.n
+        self.n += 1
+        return i
+
+    def _grow(self):
+        capacity = 2 * len(self.load)
+        for name in ("q", "r", "role", "load", "hunger", "hunger_time", "max_hunger"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype = old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    # Advance the Hunger Clock (O(1): No Row is Touched; Hunger is Evaluated when Read).
+    def advance_hunger(self, dt_ms):
+        self.now_ms += dt_ms
+
+    # Closed-Form Hunger of 1 Row.
+    def hunger_of(self, i):
+        return min(float(self.max_hunger[i]), float(self.hunger[i]) + agent_hunger_growth(self.now_ms - int(self.hunger_time[i])))
+
+    def set_hunger(self, i, value):
+        self.hunger[i] = value
+        self.hunger_time[i] = self.now_ms
+
+    # Closed-Form Hunger of Every Agent in 1 Pass.
+    def hunger_values(self):
+        n = self.n
+        return np.minimum(self.max_hunger[:n], self.hunger[:n] + agent_hunger_growth(self.now_ms - self.hunger_time[:n]))
+
+    # Stored Hunger as (Value at Last Write, ms Since that Write) -> Replay Keyframes.
+    def hunger_state(self):
+        n = self.n
+        return self.hunger[:n].copy(), self.now_ms - self.hunger_time[:n]
+
+    # Overwrite Every Agent's Hunger from hunger_state() Arrays (e.g. a Replay Keyframe).
+    def restore_hunger(self, hunger, age_ms):
+        n = self.n
+        self.hunger[:n] = hunger
+        self.hunger_time[:n] = self.now_ms - np.asarray(age_ms, dtype = np.int64)
+
+    # Boolean Mask of Agents Passing a Partner Filter (see PARTNER_FILTERS).
+    def eligible(self, name):
+        role, pred = PARTNER_FILTERS[name]
+        n = self.n
+        return (self.role[:n] == ROLE_CODES[role]) & pred(self.load[:n])
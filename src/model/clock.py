@@ -0,0 +1,17 @@
+class SimClock:
+    """Deterministic Simulated-Time Clock Advanced by a Fixed dt per Model Step."""
+    def __init__(self, dt_ms = 200):
+        self.dt_ms = int(dt_ms)
+        self.now_ms = 0
+        self.ticks = 0
+
+    # Simulated Seconds per Tick.
+    @property
+    def dt(self):
+        return self.dt_ms / 1000.0
+
+    # Advance 1 Fixed Step & Return dt in Seconds.
+    def tick(self):
+        self.now_ms += self.dt_ms
+        self.ticks += 1
+        return self.dt
@@ -0,0 +1,77 @@
+from src.nest.hunger_index import UNFED_THRESHOLD
+
+# Receivers Carrying Less than this Count as Hungry.
+HUNGRY_RECEIVER_LOAD = 0.1
+
+# Integer L1:L2:L3 Percentages that Sum to 100 (Largest Remainder Rounding).
+def stage_ratio(counts):
+    total = sum(counts)
+    if total == 0:
+        return (0, 0, 0)
+    raw_percentages = [c / total * 100 for c in counts]
+    rounded_percentages = [int(p) for p in raw_percentages]
+    error = 100 - sum(rounded_percentages)
+    fractions = [p - int(p) for p in raw_percentages]
+    sorted_fractions = sorted([(f, i) for i, f in enumerate(fractions)], reverse = True)
+    for i in range(error):
+        rounded_percentages[sorted_fractions[i][1]] += 1
+    return tuple(rounded_percentages)
+
+class ColonyMetrics:
+    """Running Counters behind the 6 Metric Chips -> O(1) Snapshots, Updated by Moves & Load Transfers."""
+    def __init__(self, model):
+        self.model = model
+        self.rebuild()
+
+    # Full Recount (Model Setup) -> Afterwards Only Incremental Updates.
+    def rebuild(self):
+        grid = self.model.nest_grid
+        self.periphery_radius = grid.visible_radius + 1
+        self.hungry_receivers = 0
+        self.foragers_total = 0
+        self.foragers_on_periphery = 0
+        for agent in self.model.ui_agents:
+            if agent.agent_type == "primary_receiver" and agent.load < HUNGRY_RECEIVER_LOAD:
+                self.hungry_receivers += 1
+            elif agent.agent_type == "forager":
+                self.foragers_total += 1
+                if grid.center_dist.get(agent.pos) == self.periphery_radius:
+                    self.foragers_on_periphery += 1
+        self.refresh_stages()
+
+    # Larval Stage Mix Only Changes when a Cell's Stage Does.
+    def refresh_stages(self):
+        grid = self.model.nest_grid
+        counts = grid.stage_counts()
+        self.larva_total = grid.larva_count()
+        self.l_ratio = stage_ratio([counts['larva1'], counts['larva2'], counts['larva3']])
+        self.stage_cursor = len(grid.stage_changes)
+
+    # Load Transfer Hook (Called from WaspAgent.load Setter).
+    def on_load(self, agent, old_load, new_load):
+        if agent.agent_type == "primary_receiver":
+            self.hungry_receivers += (new_load < HUNGRY_RECEIVER_LOAD) - (old_load < HUNGRY_RECEIVER_LOAD)
+
+    # Move Hook (Called from WaspAgent.move_to_pos).
+    def on_move(self, agent, old_pos, new_pos):
+        if agent.agent_type == "forager":
+            center_dist = self.model.nest_grid.center_dist
+            r = self.periphery_radius
+            self.foragers_on_periphery += (center_dist.get(new_pos) == r) - (center_dist.get(old_pos) == r)
+
+    # All 6 Chip Values.
+    def snapshot(self):
+        model = self.model
+        grid = model.nest_grid
+        if self.stage_cursor != len(grid.stage_changes):
+            self.refresh_stages()
+        steps = model.current_bout_steps
+        unfed = grid.unfed_count(UNFED_THRESHOLD)
+        return {
+            "route_efficiency": (model.current_bout_larvae_fed / steps) * 100 if steps else 0,
+            "unfed_pct": unfed / self.larva_total * 100 if self.larva_total else 0,
+            "l_ratio": self.l_ratio,
+            "bout_count": model.bout_count,
+            "hungry_receivers": self.hungry_receivers,
+            "radial_bias": (self.foragers_on_periphery / self.foragers_total) * 100 if self.foragers_total > 0 else 0.0,
+        }
@@ -0,0 +1,92 @@
+from collections import OrderedDict, deque
+from src.utils.helpers import hex_distance
+
+class FlowFields:
+    """Cached BFS Distance Fields toward Targets Outside the Border Ring -> Agents Step by Table Lookup."""
+    # Total Field Entries (Cells) Kept Before the Least Recently Used Fields are Dropped.
+    MAX_CELLS = 1_000_000
+
+    def __init__(self, nest_grid):
+        self.grid = nest_grid
+        self.fields = OrderedDict()
+        self.cached_cells = 0
+        # Border Cells as of the Last Synced Stage Change; Greedy Steps Hold Only while they are Exactly the Outer Ring.
+        self.borders = {pos for pos, cell in nest_grid.cells.items() if cell.stage == "border"}
+        self.ring_borders = self.borders == set(nest_grid.ring(nest_grid.visible_radius))
+        self.stage_cursor = len(nest_grid.stage_changes)
+
+    # Drop All Cached Fields (Border Cells Changed).
+    def invalidate(self):
+        self.fields.clear()
+        self.cached_cells = 0
+
+    # Catch Up on grid.stage_changes -> Any Cell Turned Into or Out of a Border Invalidates the Fields.
+    def sync(self):
+        grid = self.grid
+        changes = grid.stage_changes
+        if self.stage_cursor == len(changes): return
+        changed = False
+        for pos in changes[self.stage_cursor:]:
+            is_border = grid.cells[pos].stage == "border"
+            if is_border != (pos in self.borders):
+                self.borders ^= {pos}
+                changed = True
+        self.stage_cursor = len(changes)
+        if changed:
+            self.invalidate()
+            self.ring_borders = self.borders == set(grid.ring(grid.visible_radius))
+
+    # Hex Steps to Target Avoiding Border Cells (Target Itself is Always Enterable).
+    def field(self, target):
+        dist = self.fields.get(target)
+        if dist is not None:
+            self.fields.move_to_end(target)
+            return dist
+
+        cells, neighbors = self.grid.cells, self.grid.neighbors
+        dist = {target: 0}
+        frontier = deque([target])
+        while frontier:
+            pos = frontier.popleft()
+            d = dist[pos] + 1
+            for n_pos in neighbors[pos]:
+                if n_pos not in dist and cells[n_pos].stage != "border":
+                    dist[n_pos] = d
+                    frontier.append(n_pos)
+
+        self.fields[target] = dist
+        self.cached_cells += len(dist)
+        while self.cached_cells > self.MAX_CELLS and len(self.fields) > 1:
+            self.cached_cells -= len(self.fields.popitem(last = False)[1])
+        return dist
+
+    # Next Hex from pos toward target (pos if Already There or Stuck).
+    # can_cross_border Agents see an Obstacle-Free Hex Disk, so Plain Hex Distance is their Exact Field.
+    # Border Cells Only Form the Ring at visible_radius, so the Interior Disk is Convex: Greedy Steps over
+    # Interior Neighbours are Exact when pos & target are Both Inside -> BFS Only for Targets Outside
+    # (or Everywhere, Once Restaged Cells Break the Ring).
+    def next_step(self, pos, target, can_cross_border):
+        self.sync()
+        grid = self.grid
+        if pos == target or target not in grid.cells:
+            return pos
+        neighbors = grid.neighbors.get(pos, [])
+
+        center_dist, r = grid.center_dist, grid.visible_radius
+        inside = not can_cross_border and self.ring_borders and center_dist[pos] < r and center_dist[target] < r
+        if can_cross_border or inside:
+            best, best_dist = pos, hex_distance(pos, target)
+            for n_pos in neighbors:
+                if inside and center_dist[n_pos] >= r: continue
+                d = hex_distance(n_pos, target)
+                if d < best_dist:
+                    best, best_dist = n_pos, d
+            return best
+
+        dist = self.field(target)
+        best, best_dist = pos, dist.get(pos, float("inf"))
+        for n_pos in neighbors:
+            d = dist.get(n_pos)
+            if d is not None and d < best_dist:
+                best, best_dist = n_pos, d
+        return best
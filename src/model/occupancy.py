@@ -0,0 +1,38 @@
+class HexOccupancy:
+    """Sparse Hex-Native Agent Occupancy Keyed Directly on Axial CoOrds."""
+    def __init__(self, cells):
+        # Only Nest Hexes are Valid -> Memory Scales w/ Occupied Cells, not a Bounding Square.
+        self.valid = cells
+        self.occupants = {}
+
+    # Put Agent on a Hex & Set agent.pos.
+    def place_agent(self, agent, pos):
+        if pos not in self.valid:
+            raise ValueError(f"Position {pos} is Outside the Nest.")
+        self.occupants.setdefault(pos, []).append(agent)
+        agent.pos = pos
+
+    # Take Agent off its Current Hex.
+    def remove_agent(self, agent):
+        bucket = self.occupants.get(agent.pos)
+        if bucket is None: return
+        bucket.remove(agent)
+        if not bucket:
+            del self.occupants[agent.pos]
+        agent.pos = None
+
+    def move_agent(self, agent, pos):
+        self.remove_agent(agent)
+        self.place_agent(agent, pos)
+
+    # Agents on 1 Hex (O(1)).
+    def agents_at(self, pos):
+        return self.occupants.get(pos, ())
+
+    # Agents on Several Hexes, in Hex Order then Arrival Order.
+    def agents_in(self, positions):
+        occupants = self.occupants
+        for pos in positions:
+            bucket = occupants.get(pos)
+            if bucket:
+                yield from bucket
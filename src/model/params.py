@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+@dataclass
+class SimParams:
+    """Plain Sim Parameter Set Handed to WaspModel (No UI Required)."""
+    nest_radius: int = 5
+    n_for: int = 5
+    n_rec: int = 10
+    n_fed: int = 5
+    max_bouts: int = 15
+    food_scarcity: float = 0.5
+    prey_respawn_interval: float = 5.0
+    max_prey_on_map: int = 3
+    step_dt_ms: int = 200
+    grid_backend: str = "dict"
+    # None -> Fresh OS Entropy (the Drawn Seed is Kept in WaspModel.seed & summary()).
+    seed: int | None = None
+
+# Feeder Count Derived from Receiver Count (Same Rule as the UI Sliders).
+def default_feeders(n_rec):
+    return n_rec // 2 if n_rec > 0 else 10
@@ -0,0 +1,137 @@
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+import numpy as np
+
+# Histogram Bucket Upper Edges (Milliseconds), Log-Spaced; the Last Bucket Catches Everything Slower.
+BUCKET_EDGES_MS = [0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100]
+
+class LatencyHistogram:
+    """Rolling Window of the Last N Phase Latencies (Ring Buffer) + Lifetime Count & Total."""
+    def __init__(self, window = 1024):
+        self.samples = np.zeros(window)
+        self.cursor = 0
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        self.samples[self.cursor] = seconds
+        self.cursor = (self.cursor + 1) % len(self.samples)
+        self.count += 1
+        self.total += seconds
+
+    # Samples Currently in the Window (Milliseconds, Unordered).
+    def window_ms(self):
+        return self.samples[:min(self.count, len(self.samples))] * 1000.0
+
+    def percentile(self, p):
+        ms = self.window_ms()
+        return float(np.percentile(ms, p)) if len(ms) else 0.0
+
+    # Most Recent Sample (Milliseconds).
+    @property
+    def last_ms(self):
+        return float(self.samples[self.cursor - 1]) * 1000.0 if self.count else 0.0
+
+    # (Upper Edge ms, Count) per Bucket over the Window; Edge None = Slower than the Last Edge.
+    def buckets(self):
+        counts = np.bincount(np.searchsorted(BUCKET_EDGES_MS, self.window_ms()), minlength = len(BUCKET_EDGES_MS) + 1)
+        return list(zip(BUCKET_EDGES_MS + [None], counts.tolist()))
+
+    def summary(self):
+        ms = self.window_ms()
+        if not len(ms):
+            return {"count": 0}
+        p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000.0, 3),
+            "mean_ms": round(float(ms.mean()), 4),
+            "p50_ms": round(float(p50), 4),
+            "p90_ms": round(float(p90), 4),
+            "p99_ms": round(float(p99), 4),
+            "max_ms": round(float(ms.max()), 4),
+        }
+
+class StepProfiler:
+    """Opt-In Model Instrumentation: Per-Role Step Time & Calls, Named Counters, Rolling Phase Latencies."""
+    def __init__(self, window = 1024):
+        self.window = window
+        self.role_time = defaultdict(float)
+        self.role_calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.phases = {}
+        self.started = time.perf_counter()
+
+    # Phase Histogram, Created on First Use (e.g. "step", "metrics", "draw").
+    def phase(self, name):
+        hist = self.phases.get(name)
+        if hist is None:
+            hist = self.phases[name] = LatencyHistogram(self.window)
+        return hist
+
+    def record(self, phase, seconds):
+        self.phase(phase).add(seconds)
+
+    # Time a Block into a Phase: `with profiler.timed("metrics"): ...`.
+    @contextmanager
+    def timed(self, phase):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - t)
+
+    def count(self, name, n = 1):
+        self.counters[name] += n
+
+    # Step Every Agent, Charging Each Call to its Role.
+    def step_agents(self, agents):
+        clock = time.perf_counter
+        role_time, role_calls = self.role_time, self.role_calls
+        for agent in agents:
+            t = clock()
+            agent.step()
+            role_time[agent.agent_type] += clock() - t
+            role_calls[agent.agent_type] += 1
+
+    # Everything Collected so Far as Plain Data (JSON-Safe).
+    def report(self):
+        return {
+            "wall_s": round(time.perf_counter() - self.started, 3),
+            "roles": {
+                role: {
+                    "calls": self.role_calls[role],
+                    "total_ms": round(self.role_time[role] * 1000.0, 3),
+                    "mean_us": round(self.role_time[role] / self.role_calls[role] * 1e6, 3),
+                }
+                for role in sorted(self.role_calls)
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "phases": {name: hist.summary() for name, hist in self.phases.items()},
+            "histograms": {name: hist.buckets() for name, hist in self.phases.items()},
+        }
+
+    # Human-Readable Report (End of a Run).
+    def format_report(self):
+        data = self.report()
+        lines = [f"Profile ({data['wall_s']} s Wall)", "", f"{'Role':<20}{'Calls':>10}{'Total ms':>12}{'Mean us':>10}"]
+        for role, r in data["roles"].items():
+            lines.append(f"{role:<20}{r['calls']:>10}{r['total_ms']:>12.1f}{r['mean_us']:>10.2f}")
+        lines += ["", f"{'Phase':<20}{'Count':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'Max ms':>10}"]
+        for name, s in data["phases"].items():
+            if s["count"]:
+                lines.append(f"{name:<20}{s['count']:>10}{s['p50_ms']:>10.3f}{s['p90_ms']:>10.3f}{s['p99_ms']:>10.3f}{s['max_ms']:>10.3f}")
+        lines += ["", f"{'Counter':<32}{'Count':>10}"]
+        for name, n in data["counters"].items():
+            lines.append(f"{name:<32}{n:>10}")
+        return "\n".join(lines)
+
+    # Write the Report as JSON (path Ending in .json) or Text.
+    def dump(self, path):
+        with open(path, "w") as f:
+            if path.endswith(".json"):
+                json.dump(self.report(), f, indent = 2)
+            else:
+                f.write(self.format_report() + "\n")
@@ -0,0 +1,25 @@
+import random
+import numpy as np
+
+# Independent Substreams, in Spawn Order (Appending a Name Never Changes Existing Streams).
+STREAMS = ["layout", "placement", "prey", "search"]
+
+# stdlib Random Seeded w/ 128 Bits Drawn from a SeedSequence.
+def seeded_random(seed_seq):
+    return random.Random(int.from_bytes(seed_seq.generate_state(4).tobytes(), "little"))
+
+class RandomStreams:
+    """Model-Owned Seeded RNG Split into Independent Named Substreams (1 SeedSequence Child Each)."""
+    def __init__(self, seed = None):
+        # seed None -> Fresh OS Entropy, Recorded in self.seed so the Run can be Reproduced.
+        self.seed_seq = np.random.SeedSequence(seed)
+        self.seed = self.seed_seq.entropy
+        children = dict(zip(STREAMS, self.seed_seq.spawn(len(STREAMS))))
+
+        # Batched Draws (Whole-Nest Layout, Agent Placement) -> NumPy Generator.
+        self.layout = np.random.default_rng(children["layout"])
+        self.placement = np.random.default_rng(children["placement"])
+
+        # Per-Event Scalar Draws (Prey Spawn Cell, Forager Search Heading) -> stdlib Random (Cheaper per Call).
+        self.prey = seeded_random(children["prey"])
+        self.search = seeded_random(children["search"])
@@ -0,0 +1,91 @@
+import argparse
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, fields, replace
+import numpy as np
+import yaml
+from src.model.params import SimParams, default_feeders
+from src.model.wasp_model import WaspModel
+
+# UI Slider Labels -> SimParams Field Names (Sweep Files may use Either).
+SLIDER_FIELDS = {
+    "Nest Radius": "nest_radius",
+    "Forager %": "n_for",
+    "Primary Receiver %": "n_rec",
+    "Max Bouts": "max_bouts",
+    "Food Scarcity": "food_scarcity",
+}
+
+PARAM_FIELDS = [f.name for f in fields(SimParams)]
+
+# Expand {param: [values]} into One SimParams per Combination.
+def expand_grid(param_grid):
+    grid = {SLIDER_FIELDS.get(k, k): (v if isinstance(v, (list, tuple)) else [v]) for k, v in param_grid.items()}
+    unknown = [k for k in grid if k not in PARAM_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown Sweep Parameter(s): {', '.join(unknown)}")
+
+    keys = list(grid)
+    combos = []
+    for values in itertools.product(*(grid[k] for k in keys)):
+        kwargs = dict(zip(keys, values))
+        if "n_fed" not in kwargs and "n_rec" in kwargs:
+            kwargs["n_fed"] = default_feeders(kwargs["n_rec"])
+        combos.append(SimParams(**kwargs))
+    return combos
+
+# Independent, Reproducible Per-Run Seeds from 1 Base Seed.
+def run_seeds(base_seed, n_runs):
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(base_seed).spawn(n_runs)]
+
+# Worker: 1 Full Headless Run -> Flat Summary Row.
+def run_one(run_id, config_id, replicate, params, seed, max_steps = None):
+    model = WaspModel(replace(params, seed = seed))
+    model.run(max_steps = max_steps)
+    row = {"run_id": run_id, "config_id": config_id, "replicate": replicate, "seed": seed}
+    row.update(asdict(model.params))
+    row.update(model.summary())
+    return row
+
+# Fan All (Config x Replicate) Runs Out Across a Process Pool, Streaming Rows to CSV as they Finish.
+def run_sweep(param_grid, replicates, out_path, base_seed = 0, max_workers = None, max_steps = None):
+    configs = expand_grid(param_grid)
+    jobs = [(c_id, rep, params) for c_id, params in enumerate(configs) for rep in range(replicates)]
+    seeds = run_seeds(base_seed, len(jobs))
+
+    done = 0
+    with open(out_path, "w", newline = "") as f, ProcessPoolExecutor(max_workers = max_workers) as pool:
+        futures = [
+            pool.submit(run_one, run_id, c_id, rep, params, seeds[run_id], max_steps)
+            for run_id, (c_id, rep, params) in enumerate(jobs)
+        ]
+        writer = None
+        for fut in as_completed(futures):
+            row = fut.result()
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames = list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            f.flush()
+            done += 1
+    return done
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "ARM Headless Parameter Sweep.")
+    parser.add_argument("grid", help = "YAML File Mapping Params (or Slider Labels) -> List of Values.")
+    parser.add_argument("-n", "--replicates", type = int, default = 1)
+    parser.add_argument("-o", "--out", default = "sweep_results.csv")
+    parser.add_argument("-s", "--seed", type = int, default = 0)
+    parser.add_argument("-j", "--workers", type = int, default = os.cpu_count())
+    parser.add_argument("--max-steps", type = int, default = None)
+    args = parser.parse_args(argv)
+
+    with open(args.grid) as f:
+        param_grid = yaml.safe_load(f) or {}
+    n = run_sweep(param_grid, args.replicates, args.out, args.seed, args.workers, args.max_steps)
+    print(f"{n} Runs Written to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+import bisect
+import struct
+import numpy as np
+from src.model.agent_state import AgentState, ROLES, ROLE_CODES
+from src.model.clock import SimClock
+from src.model.metrics import ColonyMetrics
+from src.model.occupancy import HexOccupancy
+from src.nest.array_grid import STAGES, STAGE_CODES
+from src.nest.grid import NestGrid
+
+# File Layout: HEADER, Agent Table, Cell Table, then 1 Frame per Step (Frame 0 = State Before the 1st Step).
+# Frame: FRAME Header | Positions (Keyframe int16 q[n], r[n] / Delta int8 dq[n], dr[n]) | float32 load[n] | Events
+#        + Keyframes Only: float64 Agent Hunger[n] | uint32 Agent Hunger Age (ms)[n] | float64 Cell Hunger[n_cells]
+#          | uint32 Cell Hunger Age (ms)[n_cells] | uint16 Prey Count | Preys
+# Hunger is Stored as Written (Value + ms Since the Write), so Replays Evaluate it Bit-for-Bit Like the Live Model.
+MAGIC = b"WTRJ"
+VERSION = 2
+HEADER = struct.Struct("<4sHIIIHH")   # Magic, Version, Agents, Cells, dt (ms), Nest Radius, Keyframe Interval
+FRAME = struct.Struct("<IQBHIdH")     # Tick, Sim Time (ms), Flags, Bout Count, Bout Steps, Bout Larvae Fed, Events
+PREY_COUNT = struct.Struct("<H")
+KEYFRAME = 1
+
+AGENT_DTYPE = np.dtype([("uid", "<u4"), ("role", "u1"), ("max_hunger", "<f8")])
+CELL_DTYPE = np.dtype([("q", "<i2"), ("r", "<i2"), ("stage", "u1")])
+EVENT_DTYPE = np.dtype([("kind", "u1"), ("q", "<i2"), ("r", "<i2"), ("value", "<f8")])
+PREY_DTYPE = np.dtype([("q", "<i2"), ("r", "<i2"), ("load", "<f8")])
+
+# Event Kind Name <-> Compact Event Code (Logged via WaspModel.log_event).
+EVENTS = ["prey_spawn", "prey_capture", "larva_feed", "bout_start", "bout_end"]
+EVENT_CODES = {kind: i for i, kind in enumerate(EVENTS)}
+
+class TrajectoryWriter:
+    """Model Observer Appending 1 Fixed-Width Binary Record per Step (Delta-Encoded Moves + Periodic Keyframes)."""
+    def __init__(self, path, model, keyframe_every = 64):
+        self.model = model
+        self.keyframe_every = keyframe_every
+        self.file = open(path, "wb")
+        self.frames = 0
+        self.last_tick = None
+        self.q = self.r = None
+        model.events = []
+        self.write_header(model)
+        self.write_frame(model, keyframe = True)
+        model.add_observer(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Detach from the Model & Flush the File.
+    def close(self):
+        if self.file.closed: return
+        self.model.remove_observer(self)
+        self.model.events = None
+        self.file.close()
+
+    # Static Run Description: Agent Roles & Nest Layout (Replays Rebuild the Nest w/o Rerunning the RNG).
+    def write_header(self, model):
+        grid = model.nest_grid
+        agents = np.array(
+            [(a.unique_id, ROLE_CODES[a.agent_type], a.max_hunger) for a in model.ui_agents], dtype = AGENT_DTYPE
+        )
+        cells = np.array([(q, r, STAGE_CODES[c.stage]) for (q, r), c in grid.cells.items()], dtype = CELL_DTYPE)
+        self.file.write(HEADER.pack(
+            MAGIC, VERSION, len(agents), len(cells), model.clock.dt_ms, grid.visible_radius, self.keyframe_every
+        ))
+        self.file.write(agents.tobytes())
+        self.file.write(cells.tobytes())
+
+    # Engine Observer Callback (the Final No-Op Notify of a Finished Run Writes Nothing).
+    def on_step(self, model):
+        if model.clock.ticks == self.last_tick: return
+        self.write_frame(model, keyframe = self.frames % self.keyframe_every == 0)
+
+    def write_frame(self, model, keyframe):
+        state = model.agent_state
+        n = state.n
+        q, r = state.q[:n], state.r[:n]
+        if not keyframe:
+            dq, dr = q - self.q, r - self.r
+            keyframe = n > 0 and max(np.abs(dq).max(), np.abs(dr).max()) > 127
+
+        events = np.array([(EVENT_CODES[kind], p[0], p[1], v) for kind, p, v in model.events], dtype = EVENT_DTYPE)
+        model.events.clear()
+        parts = [FRAME.pack(
+            model.clock.ticks, model.now_ms, KEYFRAME if keyframe else 0, model.bout_count,
+            model.current_bout_steps, model.current_bout_larvae_fed, len(events)
+        )]
+        if keyframe:
+            parts += [q.astype("<i2").tobytes(), r.astype("<i2").tobytes()]
+        else:
+            parts += [dq.astype("i1").tobytes(), dr.astype("i1").tobytes()]
+        parts += [state.load[:n].astype("<f4").tobytes(), events.tobytes()]
+        if keyframe:
+            preys = np.array([(p[0], p[1], load) for p, load in model.preys], dtype = PREY_DTYPE)
+            agent_hunger, agent_age = state.hunger_state()
+            cell_hunger, cell_age = model.nest_grid.hunger_state()
+            parts += [
+                agent_hunger.astype("<f8").tobytes(),
+                agent_age.astype("<u4").tobytes(),
+                cell_hunger.astype("<f8").tobytes(),
+                cell_age.astype("<u4").tobytes(),
+                PREY_COUNT.pack(len(preys)),
+                preys.tobytes(),
+            ]
+        self.file.write(b"".join(parts))
+
+        self.q, self.r = q.copy(), r.copy()
+        self.last_tick = model.clock.ticks
+        self.frames += 1
+
+class TrajectoryReader:
+    """Memory-Mapped Trajectory File -> 1 Header Scan Finds Every Frame, Frames are Decoded on Demand."""
+    def __init__(self, path):
+        self.data = np.memmap(path, dtype = np.uint8, mode = "r")
+        magic, version, self.n_agents, self.n_cells, self.dt_ms, self.radius, self.keyframe_every = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a Version {VERSION} Trajectory File")
+        offset = HEADER.size
+        self.agents = np.frombuffer(self.data, AGENT_DTYPE, self.n_agents, offset)
+        offset += self.agents.nbytes
+        cells = np.frombuffer(self.data, CELL_DTYPE, self.n_cells, offset)
+        offset += cells.nbytes
+        self.layout = [((int(q), int(r)), STAGES[st]) for q, r, st in cells]
+        self.scan(offset)
+
+    # Frame Offsets & Keyframe Indices (a Truncated Last Frame, e.g. from a Killed Run, is Ignored).
+    def scan(self, offset):
+        n, size = self.n_agents, len(self.data)
+        self.offsets, self.keyframes = [], []
+        while offset + FRAME.size <= size:
+            _, _, flags, _, _, _, n_events = FRAME.unpack_from(self.data, offset)
+            end = offset + FRAME.size + 4 * n + n_events * EVENT_DTYPE.itemsize
+            if flags & KEYFRAME:
+                end += 4 * n + 12 * n + 12 * self.n_cells
+                if end + PREY_COUNT.size > size: break
+                end += PREY_COUNT.size + PREY_COUNT.unpack_from(self.data, end)[0] * PREY_DTYPE.itemsize
+            else:
+                end += 2 * n
+            if end > size: break
+            if flags & KEYFRAME:
+                self.keyframes.append(len(self.offsets))
+            self.offsets.append(offset)
+            offset = end
+
+    def __len__(self):
+        return len(self.offsets)
+
+    # Nearest Keyframe at or Before Frame i.
+    def keyframe_before(self, i):
+        return self.keyframes[bisect.bisect_right(self.keyframes, i) - 1]
+
+    # Decode Frame i into a Dict of Header Fields & Column Arrays.
+    def frame(self, i):
+        data, n, offset = self.data, self.n_agents, self.offsets[i]
+        tick, now_ms, flags, bout_count, bout_steps, bout_fed, n_events = FRAME.unpack_from(data, offset)
+        offset += FRAME.size
+        f = {
+            "tick": tick, "now_ms": now_ms, "keyframe": bool(flags & KEYFRAME),
+            "bout_count": bout_count, "bout_steps": bout_steps, "bout_fed": bout_fed,
+        }
+        pos_dtype = "<i2" if f["keyframe"] else "i1"
+        f["q"] = np.frombuffer(data, pos_dtype, n, offset)
+        f["r"] = np.frombuffer(data, pos_dtype, n, offset + n * f["q"].itemsize)
+        offset += 2 * f["q"].nbytes
+        f["load"] = np.frombuffer(data, "<f4", n, offset)
+        offset += 4 * n
+        f["events"] = np.frombuffer(data, EVENT_DTYPE, n_events, offset)
+        offset += f["events"].nbytes
+        if f["keyframe"]:
+            f["agent_hunger"] = np.frombuffer(data, "<f8", n, offset)
+            offset += 8 * n
+            f["agent_age"] = np.frombuffer(data, "<u4", n, offset)
+            offset += 4 * n
+            f["cell_hunger"] = np.frombuffer(data, "<f8", self.n_cells, offset)
+            offset += 8 * self.n_cells
+            f["cell_age"] = np.frombuffer(data, "<u4", self.n_cells, offset)
+            offset += 4 * self.n_cells
+            n_preys = PREY_COUNT.unpack_from(data, offset)[0]
+            f["preys"] = np.frombuffer(data, PREY_DTYPE, n_preys, offset + PREY_COUNT.size)
+        return f
+
+class ReplayAgent:
+    """Agent View for Replays (Same Fields the Renderer, Hover & Metrics Read; Only pos is Writable)."""
+    def __init__(self, arrays, idx, unique_id):
+        self.arrays = arrays
+        self.idx = idx
+        self.unique_id = unique_id
+
+    # Written by HexOccupancy (None while Between Hexes Mid-Move).
+    @property
+    def pos(self):
+        return (int(self.arrays.q[self.idx]), int(self.arrays.r[self.idx]))
+
+    @pos.setter
+    def pos(self, value):
+        if value is not None:
+            self.arrays.q[self.idx], self.arrays.r[self.idx] = value
+
+    @property
+    def agent_type(self):
+        return ROLES[self.arrays.role[self.idx]]
+
+    @property
+    def load(self):
+        return float(self.arrays.load[self.idx])
+
+    @property
+    def hunger(self):
+        return self.arrays.hunger_of(self.idx)
+
+    @property
+    def max_hunger(self):
+        return float(self.arrays.max_hunger[self.idx])
+
+class TrajectoryReplay:
+    """WaspModel Stand-In that Plays Back a Trajectory File -> step() Advances 1 Frame, seek() Jumps Anywhere."""
+    def __init__(self, path):
+        self.reader = reader = TrajectoryReader(path)
+        if not len(reader):
+            raise ValueError(f"{path} Holds No Complete Frames")
+        self.clock = SimClock(reader.dt_ms)
+        self.nest_grid = NestGrid(reader.radius, layout = reader.layout)
+        self.agent_state = AgentState(max(64, reader.n_agents))
+        self.ui_agents = []
+        for uid, role, max_hunger in reader.agents:
+            idx = self.agent_state.register()
+            self.agent_state.role[idx] = role
+            self.agent_state.max_hunger[idx] = max_hunger
+            self.ui_agents.append(ReplayAgent(self.agent_state, idx, int(uid)))
+        self.grid = None
+        self.preys = []
+        self.observers = []
+        self.frame = -1
+        self.bout_count = 0
+        self.current_bout_steps = 0
+        self.current_bout_larvae_fed = 0.0
+        self.metrics = None
+        self.seek(0)
+        self.metrics = ColonyMetrics(self)
+
+    # Current Simulated Time (in milliseconds).
+    @property
+    def now_ms(self):
+        return self.clock.now_ms
+
+    # Frames Played so Far (Mirrors Model.steps for the UI).
+    @property
+    def steps(self):
+        return self.frame
+
+    # False Only on the Last Frame -> Seeking Back Resumes Playback.
+    @property
+    def running(self):
+        return self.frame < len(self.reader) - 1
+
+    def add_observer(self, observer):
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def notify_observers(self):
+        for observer in self.observers:
+            observer.on_step(self)
+
+    # Advance 1 Frame (No Agent Logic Runs).
+    def step(self):
+        if self.running:
+            self.apply(self.frame + 1)
+            self.refresh()
+        self.notify_observers()
+
+    # Jump to Frame i: Restore the Nearest Earlier Keyframe, then Roll Forward Delta Frames.
+    def seek(self, i):
+        i = max(0, min(len(self.reader) - 1, i))
+        start = i if i == self.frame + 1 else self.reader.keyframe_before(i)
+        if self.frame < start or self.frame > i:
+            self.apply(start)
+        for k in range(self.frame + 1, i + 1):
+            self.apply(k)
+        self.refresh()
+        self.notify_observers()
+
+    # Apply 1 Frame onto the Current State (Delta Frames Need Frame i - 1 Applied Before).
+    def apply(self, i):
+        f = self.reader.frame(i)
+        state, n = self.agent_state, self.agent_state.n
+        if f["keyframe"]:
+            self.grid = HexOccupancy(self.nest_grid.cells)
+            for agent, q, r in zip(self.ui_agents, f["q"].tolist(), f["r"].tolist()):
+                self.grid.place_agent(agent, (q, r))
+            state.restore_hunger(f["agent_hunger"], f["agent_age"])
+            self.nest_grid.restore_hunger(f["cell_hunger"], f["cell_age"])
+            self.preys[:] = [((int(q), int(r)), float(load)) for q, r, load in f["preys"]]
+        else:
+            # Same Order as WaspModel.step: Hunger Clocks, then Agent Events (Prey, Feeds) in Logged Order.
+            dq, dr = f["q"], f["r"]
+            for k in np.flatnonzero(dq | dr).tolist():
+                agent = self.ui_agents[k]
+                q, r = agent.pos
+                self.grid.move_agent(agent, (q + int(dq[k]), r + int(dr[k])))
+            state.advance_hunger(self.clock.dt_ms)
+            self.nest_grid.advance_hunger(self.clock.dt_ms)
+            for kind, q, r, value in f["events"]:
+                self.apply_event(EVENTS[kind], (int(q), int(r)), float(value))
+        state.load[:n] = f["load"]
+        self.clock.ticks, self.clock.now_ms = f["tick"], f["now_ms"]
+        self.bout_count = f["bout_count"]
+        self.current_bout_steps = f["bout_steps"]
+        self.current_bout_larvae_fed = f["bout_fed"]
+        self.frame = i
+
+    def apply_event(self, kind, pos, value):
+        if kind == "prey_spawn":
+            self.preys.append((pos, value))
+        elif kind == "prey_capture":
+            for i, (p, _) in enumerate(self.preys):
+                if p == pos:
+                    self.preys.pop(i)
+                    break
+        elif kind == "larva_feed":
+            self.nest_grid.cells[pos].feed(value)
+
+    # Metric Counters are Recounted (Replays have No Move / Load Hooks).
+    def refresh(self):
+        if self.metrics is not None:
+            self.metrics.rebuild()
@@ -1,118 +1,266 @@
+import time
 from mesa import Model
-from mesa.space import MultiGrid
 from src.agents.forager import Forager
 from src.agents.primary_receiver import PrimaryReceiver
 from src.agents.secondary_feeder import SecondaryFeeder
+from src.model.agent_index import AgentIndex
+from src.model.agent_state import AgentState
+from src.model.clock import SimClock
+from src.model.metrics import ColonyMetrics
+from src.model.navigation import FlowFields
+from src.model.occupancy import HexOccupancy
+from src.model.params import SimParams
+from src.model.profiler import StepProfiler
+from src.model.rng import RandomStreams
+from src.nest.array_grid import ArrayNestGrid
 from src.nest.grid import NestGrid
-from src.utils.helpers import hex_distance
-import random
+
+# SimParams.grid_backend -> NestGrid Implementation.
+GRID_BACKENDS = {"dict": NestGrid, "array": ArrayNestGrid}
+
+# Headless Runs Stop after this Many Bout Durations per Requested Bout (Summary Marks them Truncated).
+RUN_TIME_LIMIT_BOUTS = 4
 
 class WaspModel(Model):
     """Main Simulation Model for Grid, Agents & Bout Cycles"""
-    def __init__(self, ui, n_for: int, n_rec: int, n_fed: int, max_bouts: int, food_scarcity: float):
-        super().__init__()
-        self.ui = ui
+    def __init__(self, params: SimParams):
+        # Seeded Substreams (Layout, Placement, Prey, Forager Search) -> Same (params, seed) = Same Run.
+        streams = RandomStreams(params.seed)
+        super().__init__(seed = streams.seed)
+        self.streams = streams
+        self.seed = streams.seed
+        self.params = params
         self.schedule = []
-        
+        self.observers = []
+
         # Sim Params
-        self.n_for = n_for
-        self.n_rec = n_rec
-        self.n_fed = n_fed
-        self.max_bouts = max_bouts
-        self.food_scarcity = food_scarcity
+        self.n_for = params.n_for
+        self.n_rec = params.n_rec
+        self.n_fed = params.n_fed
+        self.max_bouts = params.max_bouts
+        self.food_scarcity = params.food_scarcity
         self.ui_agents = []
-        
+
+        # Simulated-Time Clock -> Fixed dt per Step (Default 200ms, Matches the Old ~5steps/s UI Pace).
+        self.clock = SimClock(params.step_dt_ms)
+
+        # Prey Management
+        self.preys = []
+        self.prey_respawn_timer = 0.0
+        self.prey_respawn_interval = params.prey_respawn_interval
+        self.max_prey_on_map = params.max_prey_on_map
+
         # Metrics & Bout Management
         self.food_in_system = 0.0
         self.current_bout = False
         self.current_bout_steps = 0
-        self.current_bout_larvae_fed = 0.0 
+        self.current_bout_larvae_fed = 0.0
+        self.total_larvae_fed = 0.0
         self.bout_count = 0
+        self.truncated = False
 
         # 1 Bout = 15 Seconds (in milliseconds) (Only for Simulation Purposes.)
-        self.bout_duration_ms = 15 * 1000 
+        self.bout_duration_ms = 15 * 1000
         self.bout_start_time = None
-        self.MESA_GRID_SIZE = 100 
-        self.OFFSET = 50 
-        self.grid = MultiGrid(self.MESA_GRID_SIZE, self.MESA_GRID_SIZE, False)
+        self.grid = None
+        self.metrics = None
+
+        # Event Log (a List only while a TrajectoryWriter is Attached, so Logging is Free Otherwise).
+        self.events = None
+
+        # StepProfiler while Profiling is Switched On (None -> step() Takes the Untimed Path).
+        self.profiler = None
         self.setup()
+        self.spawn_prey()
+        self.start_new_bout(self.now_ms)
+
+    # Current Simulated Time (in milliseconds).
+    @property
+    def now_ms(self):
+        return self.clock.now_ms
+
+    # Register an Observer (e.g. WaspSimUI) Notified After Every Step via on_step(model).
+    def add_observer(self, observer):
+        if observer not in self.observers:
+            self.observers.append(observer)
 
-    # Hex CoOrds -> Positive MESA Grid CoOrds Converter.
-    def _shift_pos(self, pos):
-        return (pos[0] + self.OFFSET, pos[1] + self.OFFSET)
+    def remove_observer(self, observer):
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    # Append (kind, pos, value) to the Event Log (see src.model.trajectory.EVENTS).
+    def log_event(self, kind, pos = (0, 0), value = 0.0):
+        if self.events is not None:
+            self.events.append((kind, pos, value))
+
+    # Switch Instrumentation On (a Fresh Profiler Each Time) -> Returned for Querying & Reports.
+    def enable_profiling(self, window = 1024):
+        self.profiler = StepProfiler(window)
+        self.agent_index.profiler = self.profiler
+        return self.profiler
+
+    # Switch Instrumentation Off -> the Detached Profiler (Still Queryable), or None.
+    def disable_profiling(self):
+        profiler = self.profiler
+        self.profiler = None
+        self.agent_index.profiler = None
+        return profiler
+
+    # Bump a Profiler Counter (No-Op Unless Profiling is On).
+    def count(self, name, n = 1):
+        if self.profiler is not None:
+            self.profiler.count(name, n)
+
+    # Rolling Latency Histogram for a Phase ("step", "metrics", "draw"), or None when Not Profiling.
+    def latency_histogram(self, phase = "step"):
+        return self.profiler.phase(phase) if self.profiler is not None else None
 
     # Initalize Nest Grid & Place All Agents
     def setup(self):
-        radius = int(self.ui.controls.sliders["Nest Radius"].value)
-        self.ui.grid = NestGrid(radius)
-        self.nest_grid = self.ui.grid 
-        for agent in list(self.ui_agents): 
-            self.grid.remove_agent(agent)
+        radius = int(self.params.nest_radius)
+        self.nest_grid = GRID_BACKENDS[self.params.grid_backend](radius, rng = self.streams.layout)
+        self.agent_index = AgentIndex()
+        self.agent_index.profiler = self.profiler
+        self.agent_state = AgentState(max(64, self.n_for + self.n_rec + self.n_fed))
+        self.grid = HexOccupancy(self.nest_grid.cells)
+        self.navigation = FlowFields(self.nest_grid)
         self.schedule.clear()
         self.ui_agents.clear()
-        
+        self.preys.clear()
+
         # Unique ID Counter
         uid = 0
-        
-        valid_cells = [
-            p for p, c in self.ui.grid.cells.items() 
-            if c.stage != "border"
-        ]
-        
+
         internal_cells = [
-             p for p, c in self.ui.grid.cells.items() 
+             p for p, c in self.nest_grid.cells.items()
              if c.stage.startswith("larva")
         ]
-        
-        forager_launch_cells = [
-            p for p, c in self.ui.grid.cells.items() 
-            if hex_distance(p, (0, 0)) == radius + 1
-        ]
-        
+
+        forager_launch_cells = self.nest_grid.ring(radius + 1)
+
+        # Start Cells per Role Drawn in 1 Batched Call Each.
+        place = self.streams.placement
+
         # Foragers
         if forager_launch_cells:
-            for _ in range(self.n_for):
-                pos = random.choice(forager_launch_cells) if forager_launch_cells else random.choice(valid_cells)
-                a = Forager(uid, self, pos) 
-                self.grid.place_agent(a, self._shift_pos(pos))
-                a.pos = pos
+            for i in place.integers(len(forager_launch_cells), size = self.n_for).tolist():
+                pos = forager_launch_cells[i]
+                a = Forager(uid, self, pos)
+                self.grid.place_agent(a, pos)
                 self.schedule.append(a)
                 self.ui_agents.append(a)
                 uid += 1
-        
+
         # Primary Receivers
         if internal_cells:
-            for _ in range(self.n_rec):
-                pos = random.choice(internal_cells)
-                a = PrimaryReceiver(uid, self, pos) 
-                self.grid.place_agent(a, self._shift_pos(pos)) 
-                a.pos = pos
+            for i in place.integers(len(internal_cells), size = self.n_rec).tolist():
+                pos = internal_cells[i]
+                a = PrimaryReceiver(uid, self, pos)
+                self.grid.place_agent(a, pos)
                 self.schedule.append(a)
                 self.ui_agents.append(a)
                 uid += 1
 
         # Secondary Feeders
         if internal_cells:
-            for _ in range(self.n_fed):
-                pos = random.choice(internal_cells)
-                a = SecondaryFeeder(uid, self, pos) 
-                self.grid.place_agent(a, self._shift_pos(pos)) 
-                a.pos = pos
+            for i in place.integers(len(internal_cells), size = self.n_fed).tolist():
+                pos = internal_cells[i]
+                a = SecondaryFeeder(uid, self, pos)
+                self.grid.place_agent(a, pos)
                 self.schedule.append(a)
                 self.ui_agents.append(a)
                 uid += 1
 
+        self.agent_index.rebuild(self.ui_agents, self.agent_state)
+        self.metrics = ColonyMetrics(self)
+
+    # Spawn Preys in a Random, Unoccupied Cell @ Launch Ring.
+    def spawn_prey(self):
+        r = self.nest_grid.visible_radius + 1
+        launch_ring_cells = self.nest_grid.ring(r)
+        occupied_cells = {p for p, _ in self.preys}
+        available_cells = [p for p in launch_ring_cells if p not in occupied_cells]
+        if available_cells:
+            pos = self.streams.prey.choice(available_cells)
+            self.preys.append((pos, 10.0))
+            self.log_event("prey_spawn", pos, 10.0)
+
+    # Advance Simulated Clock by 1 Fixed dt: Prey Respawn, Hunger Decay & Bout Time Limit.
+    def advance_clock(self):
+        dt = self.clock.tick()
+
+        # Prey Respawn Logic
+        self.prey_respawn_timer += dt
+        if self.prey_respawn_timer > self.prey_respawn_interval and len(self.preys) < self.max_prey_on_map:
+            self.spawn_prey()
+            self.prey_respawn_timer = 0.0
+
+        # Hunger Clocks (O(1): Hunger is Evaluated in Closed Form when Read)
+        self.nest_grid.advance_hunger(self.clock.dt_ms)
+        self.agent_state.advance_hunger(self.clock.dt_ms)
+
+        self.check_bout_end_time(self.now_ms)
+
     # Termination Check & Run Agent Steps
     def step(self):
         if self.bout_count >= self.max_bouts:
-            self.ui.sim_running = False
+            self.running = False
+            self.notify_observers()
             return
-        
-        for agent in self.schedule:
-            agent.step()
-        
+
+        profiler = self.profiler
+        if profiler is None:
+            self.advance_clock()
+            for agent in self.schedule:
+                agent.step()
+        else:
+            t = time.perf_counter()
+            self.advance_clock()
+            profiler.step_agents(self.schedule)
+            profiler.record("step", time.perf_counter() - t)
+
         self.current_bout_steps += 1
-        
+        self.notify_observers()
+
+    # Push Post-Step State to All Attached Observers.
+    def notify_observers(self):
+        for observer in self.observers:
+            observer.on_step(self)
+
+    # True Once No Bout can Start Again (Bouts Start on a Prey Capture or a Delivery).
+    def stalled(self):
+        if self.current_bout: return False
+        if self.n_for == 0: return True
+        # No Receivers -> Foragers Keep their Catch, so Captures Stop Once Every Forager is Loaded.
+        return self.n_rec == 0 and len(self.agent_index.members["forager_loaded"]) >= self.metrics.foragers_total
+
+    # Step Until max_bouts is Reached (or max_steps, if Given) -> Headless Batch Runs.
+    # Stalled Runs & Runs Past max_sim_ms (Default: RUN_TIME_LIMIT_BOUTS x max_bouts Bout Durations) Stop w/ truncated Set.
+    def run(self, max_steps = None, max_sim_ms = None):
+        if max_sim_ms is None:
+            max_sim_ms = RUN_TIME_LIMIT_BOUTS * max(1, self.max_bouts) * self.bout_duration_ms
+        while self.running and (max_steps is None or self.steps < max_steps):
+            if self.now_ms >= max_sim_ms or self.stalled():
+                self.truncated = True
+                break
+            self.step()
+
+    # Run-Level Summary Row (Route Efficiency, Unfed L%, Bouts) for Headless & Batch Runs.
+    def summary(self):
+        larvae = self.nest_grid.larva_count()
+        unfed = self.nest_grid.unfed_count()
+        steps = self.clock.ticks
+        return {
+            "seed": self.seed,
+            "truncated": self.truncated,
+            "steps": steps,
+            "sim_time_ms": self.now_ms,
+            "bout_count": self.bout_count,
+            "larvae_fed": round(self.total_larvae_fed, 4),
+            "route_efficiency": round((self.total_larvae_fed / steps) * 100 if steps else 0.0, 4),
+            "unfed_pct": round(unfed / larvae * 100 if larvae else 0.0, 4),
+        }
+
     # Called by Agent on 1st Food Delivery
     def start_new_bout(self, current_time_ms):
         if not self.current_bout:
@@ -120,21 +268,23 @@ class WaspModel(Model):
             self.bout_start_time = current_time_ms
             self.current_bout_steps = 0
             self.current_bout_larvae_fed = 0.0
-    
-    # Called by UI/Frame to Check if TIme Limit has Reached.
+            self.log_event("bout_start")
+
+    # Called Every Step to Check if Time Limit has Reached.
     def check_bout_end_time(self, current_time_ms):
         if self.current_bout and self.bout_start_time is not None:
             elapsed_time = current_time_ms - self.bout_start_time
-            
+
             if elapsed_time >= self.bout_duration_ms:
                 self.bout_count += 1
                 self.food_in_system = 0.0
                 self.current_bout = False
-                self.bout_start_time = current_time_ms 
+                self.bout_start_time = current_time_ms
                 self.current_bout_steps = 0
                 self.current_bout_larvae_fed = 0.0
                 self.current_bout_steps = 0
                 self.current_bout_larvae_fed = 0.0
+                self.log_event("bout_end")
                 # print(f"Bout {self.bout_count} ended by TIME limit (1 minute).") DEBUG LINE
                 return True
         return False
\ No newline at end of file
@@ -1,12 +1,15 @@
-import random
-from src.utils.helpers import COLORS, hex_distance
+import numpy as np
+from src.nest.hunger_index import HungerIndex, UNFED_THRESHOLD, hunger_growth
+from src.utils.helpers import COLORS, HEX_DIRECTIONS, hex_distance, hex_distances, hex_ring
 
 class NestCell:
     """Represents a SINGULAR Hex Cell in Nest Capable of Holding Egg, Pupa, Larva."""
     def __init__(self, pos, stage = "empty"):
         self.pos = pos
-        self.stage = stage
+        self.stage_name = stage
         self.type = "larva" if stage.startswith("larva") else stage
+        self.grid = None
+        self.index = None
         if self.type == "larva":
             self.stage_num = int(stage[-1])
             self.max_hunger = self.stage_num
@@ -16,52 +19,187 @@ class NestCell:
             self.max_hunger = self.hunger = self.fed = 0.0
         self.visible = True
 
+    @property
+    def stage(self):
+        return self.stage_name
+
+    # Restaging Re-Derives type & Capacity, then the Grid Re-Indexes & Logs the Cell (Hunger Carried Over).
+    @stage.setter
+    def stage(self, stage):
+        if stage == self.stage_name: return
+        hunger = self.hunger
+        self.stage_name = stage
+        self.type = "larva" if stage.startswith("larva") else stage
+        self.stage_num = int(stage[-1]) if self.type == "larva" else 0
+        self.max_hunger = self.stage_num
+        if self.grid is not None:
+            self.grid.mark_stage_changed(self, hunger)
+
+    # Hunger is Stored as (Value, Write Time) & Evaluated in Closed Form on Read (Linear Growth up to max_hunger).
+    @property
+    def hunger(self):
+        if self.index is None: return self.hunger_base
+        return min(self.max_hunger, self.hunger_base + hunger_growth(self.index.now_ms - self.hunger_time))
+
+    @hunger.setter
+    def hunger(self, value):
+        self.hunger_base = value
+        self.hunger_time = self.index.now_ms if self.index is not None else 0
+
     # Reduces Larva Hunger Deficit by Given Amount (Capped by Current Hunger).
     def feed(self, amount):
         if self.type != "larva": return 0.0
-        fed = min(amount, self.hunger)
-        self.hunger -= fed
+        hunger = self.hunger
+        fed = min(amount, hunger)
+        self.hunger = hunger - fed
         self.fed += fed
+        if fed > 0 and self.index is not None:
+            self.index.update(self)
         return fed
-    
-    # Increases Larva Hunger Deficit Over Time (dt is Time Delta in Seconds).
-    def decay_hunger(self, dt):
-        if self.type != "larva": return
-        decay_rate_per_sec = 0.01
-        self.hunger = min(self.max_hunger, self.hunger + decay_rate_per_sec * dt)
 
 class NestGrid:
     """NestCell Collection in a Hexagonal Grid Layout Manager."""
-    def __init__(self, radius):
+    def __init__(self, radius, layout = None, rng = None):
         self.visible_radius = radius
         self.cells = {}
-        self.setup_grid(radius)
+        self.hunger_index = HungerIndex()
+        self.setup_grid(radius, layout, rng)
 
-    # Initiate All Cells in Grid 
-    def setup_grid(self, visible_radius):
+    # Initiate All Cells in Grid (Randomized from rng, or from a Given (pos, stage) Layout e.g. a Replay File).
+    def setup_grid(self, visible_radius, layout = None, rng = None):
         self.cells.clear()
-        center = (0, 0)
-        for q in range(-visible_radius - 1, visible_radius + 2):
+        self.hunger_index = HungerIndex()
+        self.stage_changes = []
+        if layout is None:
+            layout = self.generate_layout(visible_radius, rng)
+        self.build_cells(list(layout))
+        self.build_tables()
+
+    # Randomized Nest Layout as (pos, stage) Pairs -> Stage Draws for the Whole Nest in 2 Batched Generator Calls.
+    # rng is a NumPy Generator (None -> Unseeded).
+    def generate_layout(self, visible_radius, rng = None):
+        rng = np.random.default_rng() if rng is None else rng
+        positions = [
+            (q, r)
+            for q in range(-visible_radius - 1, visible_radius + 2)
             for r in range(max(-visible_radius - 1, -q-visible_radius - 1),
-                           min(visible_radius + 1, -q+visible_radius + 1) + 1):
-                pos = (q, r)
-                dist = hex_distance(pos, (0, 0))
-                if dist > visible_radius + 2:
-                    continue
-                elif dist == visible_radius + 1:
-                    cell = NestCell(pos, "empty")
-                elif dist == visible_radius:
-                    cell = NestCell(pos, "border")
-                else:
-                    rnd = random.random()
-                    if rnd < 0.12: st = "egg"
-                    elif rnd < 0.22: st = "pupa"
-                    elif rnd < 0.97: st = f"larva{random.choices([1, 2, 3], weights = [40, 35, 25])[0]}"
-                    else: st = "empty"
-                    cell = NestCell(pos, st)
-                self.cells[pos] = cell
+                           min(visible_radius + 1, -q+visible_radius + 1) + 1)
+        ]
+        rnds = rng.random(len(positions)).tolist()
+        larva_stages = rng.choice([1, 2, 3], size = len(positions), p = [0.40, 0.35, 0.25]).tolist()
+        q, r = np.array(positions).T
+        dists = hex_distances((0, 0), q, r).tolist()
+        for pos, dist, rnd, larva_stage in zip(positions, dists, rnds, larva_stages):
+            if dist == visible_radius + 1:
+                st = "empty"
+            elif dist == visible_radius:
+                st = "border"
+            else:
+                if rnd < 0.12: st = "egg"
+                elif rnd < 0.22: st = "pupa"
+                elif rnd < 0.97: st = f"larva{larva_stage}"
+                else: st = "empty"
+            yield pos, st
+
+    # Layout -> NestCell Objects (Larvae Registered w/ Hunger Index).
+    def build_cells(self, layout):
+        for pos, st in layout:
+            cell = NestCell(pos, st)
+            cell.grid = self
+            if cell.type == "larva":
+                cell.index = self.hunger_index
+                self.hunger_index.add(cell)
+            self.cells[pos] = cell
     
-    # Initiate Hunger Decay for All Cells in Grid
-    def decay_hunger(self, dt):
-        for cell in self.cells.values():
-            cell.decay_hunger(dt)
\ No newline at end of file
+    # Precompute Static Geometry Once: In-Nest Neighbours, Distance to Center & Ring Membership.
+    def build_tables(self):
+        cells = self.cells
+        self.neighbors = {
+            (q, r): [(q + dq, r + dr) for dq, dr in HEX_DIRECTIONS if (q + dq, r + dr) in cells]
+            for q, r in cells
+        }
+        q, r = np.array(list(cells)).T
+        self.center_dist = dict(zip(cells, hex_distances((0, 0), q, r).tolist()))
+        self.rings = {}
+        for pos, d in self.center_dist.items():
+            self.rings.setdefault(d, []).append(pos)
+
+    # Called by a Cell's stage Setter: Re-Register w/ the Hunger Index (Hunger Capped at the New Capacity) & Log the Cell
+    # -> Renderers Patch their Cached Nest Layer & Metrics Recount Stages from this Log.
+    def mark_stage_changed(self, cell, hunger = 0.0):
+        index = self.hunger_index
+        if cell.pos in index.cells:
+            index.remove(cell)
+        cell.index = None
+        cell.hunger = 0.0
+        if cell.type == "larva":
+            cell.index = index
+            cell.hunger = min(hunger, cell.max_hunger)
+            index.add(cell)
+        self.stage_changes.append(cell.pos)
+
+    # Cells Exactly k Hexes from Center (in Grid Order).
+    def ring(self, k):
+        return self.rings.get(k, [])
+
+    # Stored Hunger per Cell in Grid Order as (Value at Last Write, ms Since that Write) -> Replay Keyframes.
+    def hunger_state(self):
+        now = self.hunger_index.now_ms
+        cells = self.cells.values()
+        return np.array([c.hunger_base for c in cells]), np.array([now - c.hunger_time for c in cells])
+
+    # Overwrite Larva Hunger from hunger_state() Arrays (e.g. a Replay Keyframe) & Re-Index.
+    def restore_hunger(self, hunger, age_ms):
+        self.hunger_index = HungerIndex()
+        for cell, h, age in zip(self.cells.values(), hunger.tolist(), age_ms.tolist()):
+            if cell.type == "larva":
+                cell.index = self.hunger_index
+                cell.hunger = h
+                cell.hunger_time = -age
+                self.hunger_index.add(cell)
+
+    # Advance the Hunger Clock (O(1): No Cell is Touched; Hunger is Evaluated when Read).
+    def advance_hunger(self, dt_ms):
+        self.hunger_index.advance(dt_ms)
+
+    # Total Larva Cells.
+    def larva_count(self):
+        return sum(1 for c in self.cells.values() if c.type == "larva")
+
+    # Larvae w/ Hunger Deficit Above Threshold (Default Threshold is a Running Count -> O(1)).
+    def unfed_count(self, threshold = UNFED_THRESHOLD):
+        if threshold == UNFED_THRESHOLD:
+            return self.hunger_index.unfed
+        return sum(1 for c in self.cells.values() if c.type == "larva" and c.hunger > threshold)
+
+    # Current Hunger Deficit per Cell in Grid Order (0 for Non-Larvae).
+    def hunger_values(self):
+        return np.array([c.hunger for c in self.cells.values()], dtype = np.float64)
+
+    # Hunger Deficit as a Fraction of Capacity per Cell in Grid Order (0 for Non-Larvae) -> Heatmaps.
+    def hunger_levels(self):
+        return np.array([c.hunger / c.max_hunger if c.max_hunger else 0.0 for c in self.cells.values()])
+
+    # Larva Count per Stage ('larva1', 'larva2', 'larva3').
+    def stage_counts(self):
+        counts = {'larva1': 0, 'larva2': 0, 'larva3': 0}
+        for c in self.cells.values():
+            if c.stage in counts:
+                counts[c.stage] += 1
+        return counts
+
+    # Hungriest Larva (Hunger > 0.1) as (pos, cell), or None.
+    def hungriest_larva(self):
+        return self.hunger_index.hungriest()
+
+    # Hungriest Larva within k Hexes of pos as (pos, cell), or None.
+    def hungriest_larva_near(self, pos, k):
+        if k >= hex_distance(pos, (0, 0)) + self.visible_radius + 1:
+            return self.hungriest_larva()
+        best = None
+        for ring in range(k + 1):
+            for p in hex_ring(pos, ring):
+                c = self.cells.get(p)
+                if c and c.type == "larva" and c.hunger > 0.1 and (best is None or c.hunger > best[1].hunger):
+                    best = (p, c)
+        return best
\ No newline at end of file
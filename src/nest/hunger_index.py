@@ -0,0 +1,123 @@
+import heapq
+
+# Hunger Keys are Compared at this Precision -> Float Noise Never Outranks Insertion Order.
+KEY_DIGITS = 9
+
+# Larvae Above this Hunger Deficit Count as Unfed.
+UNFED_THRESHOLD = 0.1
+
+# Larva Hunger Deficit Growth (Units per Second).
+HUNGER_DECAY_PER_SEC = 0.01
+
+# Hunger Gained over elapsed_ms (Integer ms Keep Equal Spans Bit-Identical, whenever they Start).
+def hunger_growth(elapsed_ms):
+    return HUNGER_DECAY_PER_SEC * elapsed_ms / 1000
+
+class HungerIndex:
+    """Per-Stage Lazy Max-Heaps of Larvae Keyed by Hunger -> Hungriest Larva in O(log n); Also the Larvae's Hunger Clock."""
+    def __init__(self):
+        # Simulated ms Elapsed -> Cells Evaluate Hunger from (Value, Write Time) against this.
+        self.now_ms = 0
+        self.cells = {}
+        self.order = {}
+        self.version = {}
+        self.heaps = {}
+        self.saturated = {}
+
+        # Running Unfed Count + Min-Heap of Offsets at which Fed Larvae Cross UNFED_THRESHOLD.
+        self.unfed = 0
+        self.is_unfed = {}
+        self.crossings = []
+
+    # Total Decay Applied so Far -> Growth is Uniform, so Keys are Stored Relative to it.
+    @property
+    def offset(self):
+        return hunger_growth(self.now_ms)
+
+    # Register a Larva Cell (Insertion Order Breaks Ties, Same as Iterating grid.cells).
+    # A Re-Added Larva Keeps its Order & Version -> Entries from Before its Removal Stay Stale.
+    def add(self, cell):
+        self.cells[cell.pos] = cell
+        self.order.setdefault(cell.pos, len(self.order))
+        self.version.setdefault(cell.pos, 0)
+        self.is_unfed[cell.pos] = False
+        self.heaps.setdefault(cell.max_hunger, [])
+        self.saturated.setdefault(cell.max_hunger, [])
+        self.update(cell)
+
+    # Unregister a Larva that Changed Stage -> its Heap & Crossing Entries Go Stale.
+    def remove(self, cell):
+        pos = cell.pos
+        self.version[pos] += 1
+        self.unfed -= self.is_unfed.pop(pos)
+        del self.cells[pos]
+
+    # Re-Key a Larva after its Hunger Changed Outside Uniform Decay (e.g. Feeding).
+    def update(self, cell):
+        pos = cell.pos
+        self.version[pos] += 1
+        heap = self.heaps[cell.max_hunger]
+        heapq.heappush(heap, (round(self.offset - cell.hunger, KEY_DIGITS), self.order[pos], pos, self.version[pos]))
+        if len(heap) > 2 * len(self.cells) + 64:
+            self._compact(cell.max_hunger)
+
+        unfed = cell.hunger > UNFED_THRESHOLD
+        self.unfed += unfed - self.is_unfed[pos]
+        self.is_unfed[pos] = unfed
+        if not unfed:
+            heapq.heappush(self.crossings, (UNFED_THRESHOLD - cell.hunger + self.offset, self.version[pos], pos))
+
+    # Advance the Clock by dt_ms (O(1) per Frame) -> Only Scheduled Threshold Crossings that Came Due are Processed.
+    def advance(self, dt_ms):
+        self.now_ms += dt_ms
+        crossings = self.crossings
+        while crossings:
+            cross, ver, pos = crossings[0]
+            if ver != self.version[pos]:
+                heapq.heappop(crossings)
+                continue
+            # Cell Hunger is the Source of Truth -> a Float-Rounding Near Miss Waits for the Next Advance.
+            if cross > self.offset + 1e-9 or self.cells[pos].hunger <= UNFED_THRESHOLD:
+                break
+            heapq.heappop(crossings)
+            self.is_unfed[pos] = True
+            self.unfed += 1
+
+    # Hungriest Larva as (pos, cell) with Hunger Above min_hunger, or None.
+    def hungriest(self, min_hunger = 0.1):
+        best = None
+        for cap in self.heaps:
+            top = self._stage_top(cap)
+            if top is None: continue
+            cell = self.cells[top]
+            if best is None or (round(cell.hunger, KEY_DIGITS), -self.order[top]) > (round(best.hunger, KEY_DIGITS), -self.order[best.pos]):
+                best = cell
+        if best is None or best.hunger <= min_hunger:
+            return None
+        return best.pos, best
+
+    # Hungriest Live Entry for 1 Stage -> Capped Larvae Tie at max_hunger, so they Queue by Order.
+    def _stage_top(self, cap):
+        heap, sat = self.heaps[cap], self.saturated[cap]
+        while heap:
+            _, order, pos, ver = heap[0]
+            if ver != self.version[pos]:
+                heapq.heappop(heap)
+                continue
+            cell = self.cells[pos]
+            if cell.hunger >= cell.max_hunger:
+                heapq.heappop(heap)
+                heapq.heappush(sat, (order, pos, ver))
+                continue
+            break
+        while sat and sat[0][2] != self.version[sat[0][1]]:
+            heapq.heappop(sat)
+        if sat:
+            return sat[0][1]
+        return heap[0][2] if heap else None
+
+    # Drop Stale Entries Once they Outnumber Live Ones.
+    def _compact(self, cap):
+        live = [e for e in self.heaps[cap] if e[3] == self.version[e[2]]]
+        heapq.heapify(live)
+        self.heaps[cap] = live
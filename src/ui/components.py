@@ -1,6 +1,35 @@
 import pygame
+from collections import OrderedDict
 from src.utils.helpers import UI_COLORS
 
+class TextCache:
+    """Shared Font & Rendered-Text Surface Cache (Keyed by Font, String & Colour)."""
+    MAX_SURFACES = 1024
+    fonts = {}
+    surfaces = OrderedDict()
+
+    # 1 SysFont per (Name, Size, Bold) for the Whole UI.
+    @classmethod
+    def font(cls, name, size, bold = False):
+        key = (name, size, bold)
+        font = cls.fonts.get(key)
+        if font is None:
+            font = cls.fonts[key] = pygame.font.SysFont(name, size, bold = bold)
+        return font
+
+    # Memoized Antialiased font.render (Least Recently Used Surfaces are Dropped).
+    @classmethod
+    def render(cls, font, text, color):
+        key = (id(font), text, tuple(color))
+        surf = cls.surfaces.get(key)
+        if surf is None:
+            surf = cls.surfaces[key] = font.render(text, True, color)
+            if len(cls.surfaces) > cls.MAX_SURFACES:
+                cls.surfaces.popitem(last = False)
+        else:
+            cls.surfaces.move_to_end(key)
+        return surf
+
 class TerminalComponent:
     """All UI Panels w/ Consistent Terminal Style."""
     def __init__(self, rect, bg_color = UI_COLORS["panel_bg"],
@@ -9,7 +38,7 @@ class TerminalComponent:
         self.bg_color = bg_color
         self.border_color = border_color
         self.text_color = text_color
-        self.font = pygame.font.SysFont('monospace', 18)
+        self.font = TextCache.font('monospace', 18)
 
     # Border around Component
     def draw_border(self, surface):
@@ -29,9 +58,9 @@ class TextChip(TerminalComponent):
     def draw(self, surface):
         self.draw_bg(surface)
         self.draw_border(surface)
-        label_surf = self.font.render(self.label, True, self.text_color)
+        label_surf = TextCache.render(self.font, self.label, self.text_color)
         surface.blit(label_surf, (self.rect.x + 5, self.rect.y + 5))
-        value_surf = self.font.render(self.value, True, self.text_color)
+        value_surf = TextCache.render(self.font, self.value, self.text_color)
         surface.blit(value_surf, (self.rect.x + self.rect.width - value_surf.get_width() - 5, self.rect.y + 5))
 
 
@@ -61,7 +90,7 @@ class Button(TerminalComponent):
     def draw(self, surface):
         pygame.draw.rect(surface, self.current_color, self.rect)
         self.draw_border(surface)
-        text_surf = self.font.render(self.label, True, self.text_color)
+        text_surf = TextCache.render(self.font, self.label, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -124,7 +153,7 @@ class Slider(TerminalComponent):
         else:
             value_str = f"{self.value:.1f}"
 
-        label_surf = self.font.render(f"{self.label}: {value_str}", True, UI_COLORS["text"])
+        label_surf = TextCache.render(self.font, f"{self.label}: {value_str}", UI_COLORS["text"])
         surface.blit(label_surf, (draw_rect.x, draw_rect.y - self.font.get_height() - 5))
         bar_rect = pygame.Rect(draw_rect.x + 5, draw_rect.y, draw_rect.width - 10, 5)
         pygame.draw.rect(surface, UI_COLORS["border"], bar_rect)
@@ -162,7 +191,7 @@ class Dropdown(TerminalComponent):
     # Draw Current Selection & Menu Expander.
     def draw(self, surface, scroll_y):
         draw_rect = self.rect.move(0, -scroll_y)
-        label_surf = self.font.render(f"{self.label}: {self.selected}", True, self.text_color)
+        label_surf = TextCache.render(self.font, f"{self.label}: {self.selected}", self.text_color)
         surface.blit(label_surf, (draw_rect.x, draw_rect.y + 5))
         self.draw_border(surface)
 
@@ -174,7 +203,7 @@ class Dropdown(TerminalComponent):
 
             for i, option in enumerate(self.options):
                 item_rect = pygame.Rect(self.dropdown_rect.x, self.dropdown_rect.y + i * self.item_height, self.dropdown_rect.width, self.item_height)
-                item_surf = self.font.render(option, True, self.text_color)
+                item_surf = TextCache.render(self.font, option, self.text_color)
 
                 if option == self.selected:
                     pygame.draw.rect(surface, UI_COLORS["border"], item_rect)
@@ -1,6 +1,7 @@
 import pygame
 from src.utils.helpers import UI_COLORS
-from src.ui.components import Slider, Dropdown
+from src.ui.components import Slider, Dropdown, TextCache
+from src.model.params import SimParams, default_feeders
 
 class ControlsPanel:
     """UI Elenent Manager for Adjusting Sim Params."""
@@ -37,16 +38,28 @@ class ControlsPanel:
         current_y_pos = y
         for label, mn, mx, start in sliders_data:
             slider_rect = pygame.Rect(self.rect.x + x, self.rect.y + current_y_pos + self.label_offset_y, w, self.slider_height)
-            self.sliders[label] = Slider(slider_rect, label, mn, mx, start, pygame.font.SysFont('monospace', self.font_size))
+            self.sliders[label] = Slider(slider_rect, label, mn, mx, start, TextCache.font('monospace', self.font_size))
             current_y_pos += self.label_offset_y + self.slider_height + self.item_gap
             
         dropdown_rect = pygame.Rect(self.rect.x + x, self.rect.y + current_y_pos + self.label_offset_y, w, 30)
         self.dropdowns["Movement Algorithm"] = Dropdown(
-            dropdown_rect, "Movement Algorithm", ["Random"], pygame.font.SysFont('monospace', self.font_size)
+            dropdown_rect, "Movement Algorithm", ["Random"], TextCache.font('monospace', self.font_size)
         )
         current_y_pos += self.label_offset_y + 30 + self.item_gap
         self.content_height = current_y_pos
 
+    # Current Slider Values -> Plain SimParams for the Headless Engine.
+    def get_params(self):
+        n_rec = int(self.sliders["Primary Receiver %"].value)
+        return SimParams(
+            nest_radius = int(self.sliders["Nest Radius"].value),
+            n_for = int(self.sliders["Forager %"].value),
+            n_rec = n_rec,
+            n_fed = default_feeders(n_rec),
+            max_bouts = int(self.sliders["Max Bouts"].value),
+            food_scarcity = self.sliders["Food Scarcity"].value,
+        )
+
     # Pass Pygame Events to All Contained Control Elements.
     def handle_event(self, event, scroll_y):
         for s in self.sliders.values():
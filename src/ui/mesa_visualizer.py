@@ -1,7 +1,44 @@
 import pygame
 import math
+import numpy as np
+from collections import OrderedDict
+from src.model.agent_state import ROLES
 from src.utils.helpers import AGENT_COLORS, COLORS
 
+# Unit Hexagon Corner Offsets (Pointy-Top), Computed Once.
+HEX_CORNERS = [(math.cos(math.pi / 180 * (60 * i + 30)), math.sin(math.pi / 180 * (60 * i + 30))) for i in range(6)]
+SQRT3 = math.sqrt(3)
+
+# Transparent Key Colour for Cached Nest Layers.
+LAYER_KEY = (255, 0, 255)
+
+# Zoom Range (Below ~0.5 Only Makes Sense w/ the Level-of-Detail Path).
+MIN_ZOOM = 0.1
+MAX_ZOOM = 2.5
+
+# Below this On-Screen Hex Radius (px) Cells & Agents are Drawn as Aggregated Heatmap Tiles of LOD_TILE_PX.
+LOD_HEX_PX = 6
+LOD_TILE_PX = 8
+
+# Agent Fill Colour per Role & Loaded State (Unloaded Receivers & Feeders are Drawn at Half Brightness).
+def agent_color(agent_type, loaded):
+    if agent_type == "forager":
+        return AGENT_COLORS["forager_full"] if loaded else AGENT_COLORS["forager_empty"]
+    if agent_type in ("primary_receiver", "secondary_feeder"):
+        color = AGENT_COLORS[agent_type]
+        return color if loaded else tuple(c // 2 for c in color)
+    return (180, 180, 180)
+
+# (Role Code, Loaded) -> RGB Lookup Table for Vectorized Drawing.
+AGENT_PALETTE = np.array([[agent_color(role, loaded) for loaded in (False, True)] for role in ROLES], dtype = np.float64)
+
+class NestLayer:
+    """Nest Rasterized Once for 1 Zoom Level (origin = Pixel Offset of Nest Center)."""
+    def __init__(self, surface, origin, cursor):
+        self.surface = surface
+        self.origin = origin
+        self.cursor = cursor
+
 class HexRenderer:
     """Hex Grid & Agents Rendering using Pygame."""
     def __init__(self, rect, margin, ui):
@@ -13,62 +50,231 @@ class HexRenderer:
         self.hex_size = 30
         self.ui = ui
         self.model = None
+        self.max_layers = 4
+        self.layers = OrderedDict()
+        self.layers_grid = None
+        self.lod_grid = None
+        self.lod_cursor = 0
+        self.sprite_size = None
+        self.sprites = []
+        self.hover_key = None
+        self.hover_grid = None
+        self.hover_model = None
+        self.hover_text = ""
 
     # Hex CoOrds -> Screen Pixel CoOrds Converter.
     def axial_to_pixel(self, pos):
-        q, r = pos
-        x = self.hex_size * (math.sqrt(3) * q + math.sqrt(3)/2 * r) * self.zoom
-        y = self.hex_size * (3/2 * r) * self.zoom
+        x, y = self.axial_to_offset(pos)
         return (
             self.rect.centerx + x + self.offset_x,
             self.rect.centery + y + self.offset_y
         )
 
+    # Hex CoOrds -> Pixel Offset from Nest Center.
+    def axial_to_offset(self, pos):
+        q, r = pos
+        x = self.hex_size * (SQRT3 * q + SQRT3/2 * r) * self.zoom
+        y = self.hex_size * (3/2 * r) * self.zoom
+        return x, y
+
     # Single Hexagon Cell Corner Points Calculation.
     def hex_points(self, cx, cy):
-        points = []
-        for i in range(6):
-            angle_deg = 60 * i + 30
-            angle_rad = math.pi / 180 * angle_deg
-            x = cx + self.hex_size * math.cos(angle_rad) * self.zoom
-            y = cy + self.hex_size * math.sin(angle_rad) * self.zoom
-            points.append((x, y))
-        return points
-
-    # Draws Nest Cells.
+        s = self.hex_size
+        z = self.zoom
+        return [(cx + s * ux * z, cy + s * uy * z) for ux, uy in HEX_CORNERS]
+
+    # Zoomed Out so Far that Individual Hexes are a Few Pixels -> Draw Heatmap Tiles Instead.
+    @property
+    def lod(self):
+        return self.hex_size * self.zoom < LOD_HEX_PX
+
+    # Nest-Center-Relative Pixel Box of the Visible View (Left, Top, Right, Bottom).
+    def view_bounds(self):
+        cx, cy = self.rect.centerx + self.offset_x, self.rect.centery + self.offset_y
+        return self.rect.left - cx, self.rect.top - cy, self.rect.right - cx, self.rect.bottom - cy
+
+    # Pixel Centre Inside the Playground Rect (Grown by the Drawn Radius)?
+    def on_screen(self, px, py, radius):
+        return (self.rect.left - radius <= px <= self.rect.right + radius
+                and self.rect.top - radius <= py <= self.rect.bottom + radius)
+
+    # Axial Coordinate Arrays -> Screen Pixel Coordinate Arrays.
+    def axial_to_pixel_arrays(self, q, r):
+        x = self.hex_size * (SQRT3 * q + SQRT3/2 * r) * self.zoom
+        y = self.hex_size * (3/2 * r) * self.zoom
+        return self.rect.centerx + x + self.offset_x, self.rect.centery + y + self.offset_y
+
+    # Vectorized on_screen over Pixel Coordinate Arrays.
+    def on_screen_mask(self, x, y, radius):
+        rect = self.rect
+        return (x >= rect.left - radius) & (x <= rect.right + radius) & (y >= rect.top - radius) & (y <= rect.bottom + radius)
+
+    # Screen Positions of All Agents from the Model's Agent Arrays (Interpolated Between the Last 2 Steps at 1x).
+    def agent_pixels(self):
+        state, sched = self.ui.model.agent_state, self.ui.scheduler
+        n = state.n
+        q, r = state.q[:n], state.r[:n]
+        alpha = sched.alpha
+        if alpha < 1.0 and sched.prev_q is not None and len(sched.prev_q) == n:
+            q = sched.prev_q + (q - sched.prev_q) * alpha
+            r = sched.prev_r + (r - sched.prev_r) * alpha
+        return self.axial_to_pixel_arrays(q, r)
+
+    # Draws Nest Cells -> 1 Blit of the Cached (View-Culled) Layer, or Hunger Heatmap Tiles at Low Zoom.
     def draw_grid(self, surface, grid):
-        for pos, cell in grid.cells.items():
-            cx, cy = self.axial_to_pixel(pos)
-            color = COLORS.get(cell.stage, COLORS["empty"])
-            points = self.hex_points(cx, cy)
-            pygame.draw.polygon(surface, color, points)
-            pygame.draw.polygon(surface, COLORS["border"], points, 1)
-
-    # Draws Prey.
+        if self.lod:
+            self.draw_grid_lod(surface, grid)
+            return
+        layer = self.nest_layer(grid)
+        ox, oy = layer.origin
+        surface.blit(layer.surface, (self.rect.centerx + self.offset_x - ox, self.rect.centery + self.offset_y - oy))
+
+    # Cached Nest Layer for Current Zoom, Patched w/ Any Stage Changes Since it was Drawn.
+    def nest_layer(self, grid):
+        if grid is not self.layers_grid:
+            self.layers.clear()
+            self.layers_grid = grid
+        key = (round(self.zoom, 2), self.offset_x, self.offset_y)
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = self.build_layer(grid)
+            self.layers[key] = layer
+            if len(self.layers) > self.max_layers:
+                self.layers.popitem(last = False)
+        self.layers.move_to_end(key)
+
+        changes = grid.stage_changes
+        if layer.cursor < len(changes):
+            for pos in set(changes[layer.cursor:]):
+                self.draw_cell(layer, grid, pos)
+                for n_pos in grid.neighbors.get(pos, []):
+                    self.draw_cell(layer, grid, n_pos, outline_only = True)
+            layer.cursor = len(changes)
+        return layer
+
+    # Rasterize the Visible Part of the Nest into an Off-Screen Surface (Same Draw Order as Direct Rendering).
+    # Cells Outside the View are Culled, so Layer Size & Build Time are Bounded by the Playground, not the Nest.
+    def build_layer(self, grid):
+        pad = self.hex_size * self.zoom + 2
+        offsets = {pos: self.axial_to_offset(pos) for pos in grid.cells}
+        ox = math.ceil(max(abs(x) for x, _ in offsets.values()) + pad)
+        oy = math.ceil(max(abs(y) for _, y in offsets.values()) + pad)
+        v_left, v_top, v_right, v_bottom = self.view_bounds()
+        left, top = max(-ox, math.floor(v_left)), max(-oy, math.floor(v_top))
+        right, bottom = max(left + 1, min(ox, math.ceil(v_right))), max(top + 1, min(oy, math.ceil(v_bottom)))
+
+        layer_surf = pygame.Surface((right - left, bottom - top))
+        layer_surf.fill(LAYER_KEY)
+        layer_surf.set_colorkey(LAYER_KEY)
+        layer = NestLayer(layer_surf, (-left, -top), len(grid.stage_changes))
+        for pos, (x, y) in offsets.items():
+            if left - pad <= x <= right + pad and top - pad <= y <= bottom + pad:
+                self.draw_cell(layer, grid, pos)
+        return layer
+
+    # Draw 1 Cell (Fill + Outline) into a Layer.
+    def draw_cell(self, layer, grid, pos, outline_only = False):
+        x, y = self.axial_to_offset(pos)
+        points = self.hex_points(layer.origin[0] + x, layer.origin[1] + y)
+        if not outline_only:
+            color = COLORS.get(grid.cells[pos].stage, COLORS["empty"])
+            pygame.draw.polygon(layer.surface, color, points)
+        pygame.draw.polygon(layer.surface, COLORS["border"], points, 1)
+
+    # Static Per-Cell Arrays for Heatmap Tiles: Axial CoOrds & Stage Colour (Rebuilt for a New Grid or Restaged Cells).
+    def lod_cells(self, grid):
+        if grid is not self.lod_grid or self.lod_cursor != len(grid.stage_changes):
+            self.lod_grid = grid
+            self.lod_cursor = len(grid.stage_changes)
+            cells = list(grid.cells.values())
+            self.lod_q = np.array([c.pos[0] for c in cells], dtype = np.float64)
+            self.lod_r = np.array([c.pos[1] for c in cells], dtype = np.float64)
+            self.lod_rgb = np.array([COLORS.get(c.stage, COLORS["empty"]) for c in cells], dtype = np.float64)
+        return self.lod_q, self.lod_r, self.lod_rgb
+
+    # Low-Zoom Nest: Mean Cell Colour per Tile, Larvae Shaded toward COLORS["hungry"] by Hunger Deficit.
+    def draw_grid_lod(self, surface, grid):
+        q, r, rgb = self.lod_cells(grid)
+        frac = grid.hunger_levels()[:, None]
+        colors = rgb + (np.array(COLORS["hungry"], dtype = np.float64) - rgb) * frac
+        x, y = self.axial_to_pixel_arrays(q, r)
+        self.draw_tiles(surface, x, y, colors)
+
+    # Bin Pixel Positions into Screen Tiles (Off-Screen Points are Culled) & Blit the Mean Colour per Tile.
+    # Tiles Holding More than 1 Item are Brightened by density_gain per Extra Item (Agent Density).
+    def draw_tiles(self, surface, x, y, colors, density_gain = 0.0):
+        tile, view = LOD_TILE_PX, self.rect
+        w, h = view.width // tile + 1, view.height // tile + 1
+        tx = np.floor((x - view.x) / tile).astype(np.int64)
+        ty = np.floor((y - view.y) / tile).astype(np.int64)
+        keep = (tx >= 0) & (tx < w) & (ty >= 0) & (ty < h)
+        idx = tx[keep] * h + ty[keep]
+        counts = np.bincount(idx, minlength = w * h)
+        filled = counts > 0
+        if not filled.any(): return
+
+        tiles = np.empty((w * h, 3), dtype = np.float64)
+        tiles[:] = LAYER_KEY
+        for c in range(3):
+            sums = np.bincount(idx, weights = colors[keep, c], minlength = w * h)
+            tiles[filled, c] = sums[filled] / counts[filled]
+        if density_gain:
+            tiles[filled] *= (1.0 + density_gain * (counts[filled, None] - 1)).clip(max = 2.0)
+        np.clip(tiles, 0, 254, out = tiles, where = filled[:, None])
+
+        img = pygame.surfarray.make_surface(tiles.reshape(w, h, 3).astype(np.uint8))
+        img.set_colorkey(LAYER_KEY)
+        surface.blit(pygame.transform.scale(img, (w * tile, h * tile)), view.topleft)
+
+    # Draws Prey (Off-Screen Prey are Culled).
     def draw_preys(self, surface, preys):
         for pos, load in preys:
             px, py = self.axial_to_pixel(pos)
-            size = int(self.hex_size * self.zoom * 0.35)
+            size = max(2, int(self.hex_size * self.zoom * 0.35))
+            if not self.on_screen(px, py, size): continue
             pygame.draw.circle(surface, AGENT_COLORS["prey"], (int(px), int(py)), size)
             pygame.draw.circle(surface, (255, 255, 255), (int(px), int(py)), size, 2)
 
     # Draws WaspAgents -> Loop Iterates over self.ui.model.ui_agents (Aliased to 'agents' in Function Signature).
+    # Positions are Interpolated Between the Last 2 Model Steps when the Scheduler Runs at 1x.
+    # Off-Screen Agents are Culled; at Low Zoom Agents Collapse into Density Tiles.
     def draw_agents(self, surface, agents):
-        for agent in self.ui.model.ui_agents:
-            px, py = self.axial_to_pixel(agent.pos)
-            size = int(self.hex_size * self.zoom * 0.3)
-
-            if agent.agent_type == "forager":
-                color = AGENT_COLORS["forager_full"] if agent.load > 0.1 else AGENT_COLORS["forager_empty"]
-            elif agent.agent_type == "primary_receiver":
-                color = AGENT_COLORS["primary_receiver"] if agent.load > 0.1 else tuple(c // 2 for c in AGENT_COLORS["primary_receiver"])
-            elif agent.agent_type == "secondary_feeder":
-                color = AGENT_COLORS["secondary_feeder"] if agent.load > 0.1 else tuple(c // 2 for c in AGENT_COLORS["secondary_feeder"])
-            else:
-                color = (180, 180, 180)
-
-            pygame.draw.circle(surface, color, (int(px), int(py)), size)
-            pygame.draw.circle(surface, (255, 255, 255), (int(px), int(py)), size, 2)
+        if self.lod:
+            self.draw_agents_lod(surface)
+            return
+        # 1 Batched Blit of Pre-Rendered Sprites: Sprite Choice & Top-Left Corners Come from the Agent Arrays in Bulk.
+        state = self.ui.model.agent_state
+        n = state.n
+        size = int(self.hex_size * self.zoom * 0.3)
+        x, y = self.agent_pixels()
+        visible = np.flatnonzero(self.on_screen_mask(x, y, size))
+        kinds = (state.role[:n] * 2 + (state.load[:n] > 0.1))[visible].tolist()
+        xs = (x[visible].astype(np.int64) - size).tolist()
+        ys = (y[visible].astype(np.int64) - size).tolist()
+        sprites = self.agent_sprites(size)
+        surface.fblits([(sprites[k], (px, py)) for k, px, py in zip(kinds, xs, ys)])
+
+    # Agent Circles (Fill + White Outline) Pre-Rendered for 1 Radius, Indexed role * 2 + loaded like AGENT_PALETTE.
+    def agent_sprites(self, size):
+        if size != self.sprite_size:
+            self.sprite_size = size
+            self.sprites = []
+            for color in AGENT_PALETTE.reshape(-1, 3):
+                sprite = pygame.Surface((2 * size + 2, 2 * size + 2))
+                sprite.fill(LAYER_KEY)
+                sprite.set_colorkey(LAYER_KEY, pygame.RLEACCEL)
+                pygame.draw.circle(sprite, tuple(int(c) for c in color), (size, size), size)
+                pygame.draw.circle(sprite, (255, 255, 255), (size, size), size, 2)
+                self.sprites.append(sprite)
+        return self.sprites
+
+    # Low-Zoom Agents: Mean Role Colour per Tile (Straight from the Model's Agent Arrays), Brighter where Crowded.
+    def draw_agents_lod(self, surface):
+        state = self.ui.model.agent_state
+        n = state.n
+        colors = AGENT_PALETTE[state.role[:n], (state.load[:n] > 0.1).astype(np.int64)]
+        x, y = self.axial_to_pixel_arrays(state.q[:n], state.r[:n])
+        self.draw_tiles(surface, x, y, colors, density_gain = 0.25)
 
     # Screen Pixel CoOrds -> Hex CoOrds COnverter.
     def mouse_to_axial(self, mouse_pos):
@@ -96,12 +302,20 @@ class HexRenderer:
 
     # Zoom In/Out Function.
     def zoom_in(self):
-        self.zoom = min(2.5, self.zoom + 0.10)
+        self.zoom = min(MAX_ZOOM, self.zoom + 0.10)
     def zoom_out(self):
-        self.zoom = max(0.5, self.zoom - 0.10)
+        self.zoom = max(MIN_ZOOM, self.zoom - 0.10)
 
-    # Hoverstate Text Information Generator.
+    # Hoverstate Text, Cached Until the Hex, Grid or Model Step Changes (Occupant State Only Changes on a Step).
     def get_hover_info(self, pos, grid):
+        key = (pos, self.model.steps if self.model else None)
+        if key != self.hover_key or grid is not self.hover_grid or self.model is not self.hover_model:
+            self.hover_key, self.hover_grid, self.hover_model = key, grid, self.model
+            self.hover_text = self.build_hover_info(pos, grid)
+        return self.hover_text
+
+    # Hoverstate Text Information Generator -> Agents Come from the Model's Per-Hex Occupancy Index.
+    def build_hover_info(self, pos, grid):
         if not grid or pos not in grid.cells:
             return "Outside Nest"
         cell = grid.cells[pos]
@@ -112,12 +326,12 @@ class HexRenderer:
             lines.append(f"Hunger: {cell.hunger:.1f}/{cell.max_hunger} Units")
 
         # For Prey
-        prey_here = [load for p_pos, load in self.ui.preys if p_pos == pos]
+        prey_here = [load for p_pos, load in self.model.preys if p_pos == pos]
         if prey_here:
             lines.append(f"Prey: {prey_here[0]:.1f} Units")
 
         # For Agents
-        agents_here = [a for a in self.ui.model.ui_agents if a.pos == pos]
+        agents_here = sorted(self.model.grid.agents_at(pos), key = lambda a: a.unique_id)
         if agents_here:
             lines.append("--- Agents ---")
             for a in agents_here:
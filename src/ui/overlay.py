@@ -0,0 +1,78 @@
+import time
+import pygame
+from src.utils.helpers import UI_COLORS
+
+# Frame Phases Timed by WaspSimUI, in Loop Order -> Overlay Label.
+PHASES = {"events": "Events", "step": "Step", "metrics": "Metrics", "grid": "Grid Draw", "agents": "Agent Draw", "flip": "Flip"}
+
+class PerfOverlay:
+    """Toggleable Playground HUD: FPS, Steps/s, Per-Phase ms & Agent/Cell Counts (Text Re-Rendered Twice a Second)."""
+    def __init__(self, font, refresh = 0.5, smoothing = 0.1):
+        self.font = font
+        self.refresh = refresh
+        self.smoothing = smoothing
+        self.visible = False
+        self.phase_ms = dict.fromkeys(PHASES, 0.0)
+        self.fps = 0.0
+        self.steps_per_sec = 0.0
+        self.window_start = time.perf_counter()
+        self.window_frames = 0
+        self.window_steps = None
+        self.surface = None
+        # Bumped whenever the Blitted Surface Changes -> Lets the UI Skip Playground Redraws in Between.
+        self.generation = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.generation += 1
+        self.phase_ms = dict.fromkeys(PHASES, 0.0)
+        self.window_start = time.perf_counter()
+        self.window_frames = 0
+        self.window_steps = None
+        self.surface = None
+
+    # Smoothed ms Since t for a Phase (No-Op while Hidden).
+    def record(self, phase, t):
+        if not self.visible: return
+        ms = (time.perf_counter() - t) * 1000.0
+        self.phase_ms[phase] += (ms - self.phase_ms[phase]) * self.smoothing
+
+    # Once per Frame: Every `refresh` Seconds, Turn Frame & Step Counts into Rates and Re-Render the Text.
+    def tick(self, model):
+        if not self.visible: return
+        self.window_frames += 1
+        now = time.perf_counter()
+        elapsed = now - self.window_start
+        if self.surface is not None and elapsed < self.refresh: return
+
+        steps = model.steps if model else 0
+        if elapsed > 0 and self.window_steps is not None:
+            self.fps = self.window_frames / elapsed
+            self.steps_per_sec = max(0, steps - self.window_steps) / elapsed
+        self.window_start = now
+        self.window_frames = 0
+        self.window_steps = steps
+        self.surface = self.render(model)
+        self.generation += 1
+
+    # Compose All Lines onto 1 Translucent Surface -> Blitted as-is Until the Next Refresh.
+    def render(self, model):
+        lines = [f"FPS     {self.fps:7.1f}", f"Steps/s {self.steps_per_sec:7.1f}", ""]
+        lines += [f"{label:<11}{self.phase_ms[phase]:7.2f} ms" for phase, label in PHASES.items()]
+        if model:
+            lines += ["", f"Agents  {len(model.ui_agents):7d}", f"Cells   {len(model.nest_grid.cells):7d}"]
+
+        line_h = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 16
+        surface = pygame.Surface((width, line_h * len(lines) + 12), pygame.SRCALPHA)
+        surface.fill((*UI_COLORS["panel_bg"], 210))
+        pygame.draw.rect(surface, UI_COLORS["border"], surface.get_rect(), 1)
+        for i, line in enumerate(lines):
+            if line:
+                surface.blit(self.font.render(line, True, UI_COLORS["text"]), (8, 6 + i * line_h))
+        return surface
+
+    # Top-Right Corner of rect (Top-Left is the Legend's).
+    def draw(self, surface, rect):
+        if self.visible and self.surface is not None:
+            surface.blit(self.surface, (rect.right - self.surface.get_width() - 8, rect.y + 8))
@@ -0,0 +1,118 @@
+import datetime
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+import pygame
+
+# Encoder Process: Drains Frames into a PNG Sequence or a Raw rgb24 Stream (ffmpeg-Compatible, w/ a README Command).
+def encode_frames(frames, session_dir, fmt, fps, written):
+    raw = open(os.path.join(session_dir, "frames.rgb"), "wb") if fmt == "raw" else None
+    size = None
+    try:
+        while True:
+            item = frames.get()
+            if item is None: break
+            n, size, data = item
+            if raw:
+                raw.write(data)
+            else:
+                frame = pygame.image.frombytes(data, size, "RGB")
+                pygame.image.save(frame, os.path.join(session_dir, f"frame_{n:06d}.png"))
+            with written.get_lock():
+                written.value += 1
+    finally:
+        if raw:
+            raw.close()
+            if size:
+                w, h = size
+                with open(os.path.join(session_dir, "README.txt"), "w") as f:
+                    f.write(f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {w}x{h} -r {fps} -i frames.rgb recording.mp4\n")
+
+class FrameRecorder:
+    """Copies Playground Frames into a Bounded Queue; a Background Process Encodes them to Disk."""
+    def __init__(self, out_dir = "recordings", fmt = "png", fps = 30, max_queue = 64):
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.fps = fps
+        self.max_queue = max_queue
+        self.ctx = mp.get_context("spawn")
+        self.frames = None
+        self.worker = None
+        self.written = None
+        self.session_dir = None
+        self.last_capture = 0.0
+        self.captured = 0
+        self.dropped = 0
+        self.closers = []
+
+    @property
+    def active(self):
+        return self.worker is not None
+
+    # Stopped Sessions whose Encoder is Still Draining the Queue.
+    @property
+    def finishing(self):
+        self.closers = [t for t in self.closers if t.is_alive()]
+        return bool(self.closers)
+
+    # Frames Copied but Not Yet Encoded.
+    @property
+    def pending(self):
+        return self.captured - self.written.value if self.written else 0
+
+    # New Session Folder & Encoder Process.
+    def start(self):
+        if self.active: return
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_dir = os.path.join(self.out_dir, f"rec_{stamp}")
+        os.makedirs(self.session_dir, exist_ok = True)
+        self.frames = self.ctx.Queue(maxsize = self.max_queue)
+        self.written = self.ctx.Value("i", 0)
+        self.captured = self.dropped = 0
+        self.last_capture = 0.0
+        self.worker = self.ctx.Process(
+            target = encode_frames, args = (self.frames, self.session_dir, self.fmt, self.fps, self.written), daemon = True
+        )
+        self.worker.start()
+
+    # End the Session without Blocking the Frame: a Background Thread Queues the Sentinel & Waits for the Encoder.
+    def stop(self):
+        if not self.active: return
+        closer = threading.Thread(target = self.close_session, args = (self.frames, self.worker), daemon = True)
+        closer.start()
+        self.closers.append(closer)
+        self.worker = None
+
+    @staticmethod
+    def close_session(frames, worker):
+        frames.put(None)
+        worker.join()
+
+    # Block Until Every Stopped Session is on Disk (App Exit Only).
+    def wait(self):
+        for closer in self.closers:
+            closer.join()
+        self.closers.clear()
+
+    # Copy 1 Frame (Never Blocks): Past Half-Full the Rate is Halved, When Full the Frame is Dropped.
+    def capture(self, surface, rect):
+        if not self.active: return
+        now = time.perf_counter()
+        interval = 1.0 / self.fps
+        if self.pending > self.max_queue // 2:
+            interval *= 2
+        if now - self.last_capture < interval: return
+        self.last_capture = now
+
+        if self.pending >= self.max_queue:
+            self.dropped += 1
+            return
+        rect = rect.clip(surface.get_rect())
+        data = pygame.image.tobytes(surface.subsurface(rect), "RGB")
+        try:
+            self.frames.put_nowait((self.captured, rect.size, data))
+            self.captured += 1
+        except queue.Full:
+            self.dropped += 1
@@ -0,0 +1,103 @@
+import time
+
+class StepScheduler:
+    """Fixed-Timestep Accumulator -> Model Steps on their Own Cadence, Decoupled from Frame Rate."""
+    # Speed Multipliers (None -> As Many Steps as Fit in the Frame Budget).
+    SPEEDS = [1, 10, 100, None]
+
+    def __init__(self, steps_per_sec = 5.0, frame_budget_ms = 12.0):
+        self.step_interval = 1.0 / steps_per_sec
+        self.frame_budget = frame_budget_ms / 1000.0
+        self.speed_idx = 0
+        self.paused = False
+        self.pending_single = 0
+        self.accumulator = 0.0
+        self.prev_q = None
+        self.prev_r = None
+
+    @property
+    def speed(self):
+        return self.SPEEDS[self.speed_idx]
+
+    @property
+    def speed_label(self):
+        if self.paused: return "PAUSED"
+        return "MAX" if self.speed is None else f"{self.speed}x"
+
+    def set_speed(self, idx):
+        self.speed_idx = max(0, min(len(self.SPEEDS) - 1, idx))
+        self.accumulator = 0.0
+
+    def faster(self):
+        self.set_speed(self.speed_idx + 1)
+
+    def slower(self):
+        self.set_speed(self.speed_idx - 1)
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self.accumulator = 0.0
+
+    # Queue 1 Step to Run on Next Update (Pauses the Run).
+    def single_step(self):
+        self.paused = True
+        self.pending_single += 1
+
+    # Fraction of the Way to the Next Step -> Used to Interpolate Agent Drawing at 1x.
+    @property
+    def alpha(self):
+        if self.paused or self.speed != 1: return 1.0
+        return min(1.0, self.accumulator / self.step_interval)
+
+    # Run Due Steps for real_dt Seconds of Wall Time; Returns Steps Taken.
+    def update(self, model, real_dt):
+        if self.paused:
+            steps = 0
+            while self.pending_single and model.running:
+                self._step(model)
+                self.pending_single -= 1
+                steps += 1
+            self.pending_single = 0
+            return steps
+
+        deadline = time.perf_counter() + self.frame_budget
+        if self.speed is None:
+            steps = 0
+            while model.running and time.perf_counter() < deadline:
+                self._step(model)
+                steps += 1
+            return steps
+
+        self.accumulator += real_dt * self.speed
+        steps = 0
+        while self.accumulator >= self.step_interval and model.running:
+            self._step(model)
+            self.accumulator -= self.step_interval
+            steps += 1
+            # Over Budget -> Drop the Backlog Rather than Stall the Frame.
+            if time.perf_counter() >= deadline:
+                self.accumulator = min(self.accumulator, self.step_interval)
+                break
+        return steps
+
+    # Snapshot Positions Before Stepping Only when Drawing Interpolates (Running at 1x); Otherwise Drop the Stale One.
+    def _step(self, model):
+        if self.speed == 1 and not self.paused:
+            state = model.agent_state
+            self.prev_q = state.q[:state.n].copy()
+            self.prev_r = state.r[:state.n].copy()
+        else:
+            self.prev_q = self.prev_r = None
+        model.step()
+
+    # Forget the Pre-Step Snapshot (e.g. after a Replay Seek) -> Agents Draw at their Current Hex.
+    def drop_interpolation(self):
+        self.accumulator = 0.0
+        self.prev_q = self.prev_r = None
+
+    # Fresh Run State for a New Model (Unpaused) -> 1x Runs its Simulated Clock in Real Time.
+    def reset(self, model):
+        self.step_interval = model.clock.dt
+        self.paused = False
+        self.pending_single = 0
+        self.drop_interpolation()
@@ -1,11 +1,14 @@
 import pygame
 import datetime
-import random
-from src.utils.helpers import COLORS, AGENT_COLORS, UI_COLORS, hex_distance
-from src.ui.components import TextChip, Button
+import time
+from src.utils.helpers import COLORS, AGENT_COLORS, UI_COLORS
+from src.ui.components import TextChip, Button, TextCache
 from src.ui.controls import ControlsPanel
-from src.nest.grid import NestGrid 
 from src.ui.mesa_visualizer import HexRenderer
+from src.ui.overlay import PerfOverlay
+from src.ui.recorder import FrameRecorder
+from src.ui.scheduler import StepScheduler
+from src.model.trajectory import TrajectoryReplay
 from src.model.wasp_model import WaspModel
 
 class WaspSimUI:
@@ -17,8 +20,8 @@ class WaspSimUI:
         self.width, self.height = self.screen.get_size()
         self.margin = min(self.width, self.height) * 0.01
         self.font_size = 18
-        self.font = pygame.font.SysFont('monospace', self.font_size, bold = True)
-        self.small_font = pygame.font.SysFont('monospace', 16)
+        self.font = TextCache.font('monospace', self.font_size, bold = True)
+        self.small_font = TextCache.font('monospace', 16)
         self.bg_color = UI_COLORS["bg"]
         self.border_color = UI_COLORS["border"]
         self.text_color = UI_COLORS["text"]
@@ -26,15 +29,22 @@ class WaspSimUI:
         self.grid = None
         self.agents = []
         self.sim_running = False
+        self.replaying = False
+        self.scrubbing = False
         self.recording = False
         self.hover_info = ""
+        self.hover_pos = None
         self.scroll_y = 0
-        self.last_realtime_check = pygame.time.get_ticks()
         self.start_time = None
         self.preys = []
-        self.prey_respawn_timer = 0.0
-        self.prey_respawn_interval = 5.0
-        self.max_prey_on_map = 3
+        self.scheduler = StepScheduler()
+        self.recorder = FrameRecorder()
+        self.overlay = PerfOverlay(self.small_font)
+        # Report Path -> Every Sim Run is Profiled & its Report Written on Stop (see WaspModel.enable_profiling).
+        self.profile_path = None
+        self.metrics_dirty = False
+        self.full_redraw = True
+        self.panel_states = {}
         self.setup_layout()
         self.renderer = HexRenderer(self.playground_rect, self.margin, self)
         self.model = None
@@ -56,6 +66,13 @@ class WaspSimUI:
         # PLAYGROUND - LEGEND Box.
         self.legend_rect = pygame.Rect(self.playground_rect.x + 20, self.playground_rect.y + 20, 220, 295)
 
+        # PLAYGROUND - Replay SCRUB Bar (Along the Bottom Edge).
+        scrub_h = self.font_size + 8
+        self.scrub_rect = pygame.Rect(
+            self.playground_rect.x + 20, self.playground_rect.bottom - self.margin - scrub_h - 20,
+            self.playground_rect.width - 40, scrub_h
+        )
+
         # Right Panel STATUS Bar
         top_h = self.font_size + 12
         self.top_bar_rect = pygame.Rect(right_x, self.margin, panel_w, top_h)
@@ -139,12 +156,13 @@ class WaspSimUI:
         ctrl_rect.y += self.margin
         ctrl_rect.height -= self.margin
         self.controls = ControlsPanel(ctrl_rect, self.font_size, self.margin)
+        self.buttons = [self.start_rec_btn, self.stop_rec_btn, self.start_sim_btn, self.stop_sim_btn, self.exit_btn]
         self.max_scroll = max(0, self.controls.content_height - ctrl_rect.height)
         
     # Draws Standard Bordered Panel w/ Title.
     def draw_titled_border(self, surf, rect, title):
         color = self.border_color
-        title_surf = self.font.render(title, True, color)
+        title_surf = TextCache.render(self.font, title, color)
         tw, th = title_surf.get_width(), title_surf.get_height()
         pygame.draw.line(surf, color, (rect.x, rect.y), (rect.x + 5, rect.y), 1)
         surf.blit(title_surf, (rect.x + 10, rect.y - th // 2))
@@ -155,137 +173,185 @@ class WaspSimUI:
 
     # Recording Logic.
     def start_recording(self):
+        if self.recording: return
         self.recording = True
+        self.recorder.start()
         self.start_time = pygame.time.get_ticks()
     def stop_recording(self):
         self.recording = False
+        self.recorder.stop()
         self.start_time = None
 
-    # Spawn Preys in a Random, Unoccupied Cell @ Launch Ring.
-    def spawn_prey(self):
-        if not self.grid: return
-        r = self.grid.visible_radius + 1
-        launch_ring_cells = [p for p in self.grid.cells if hex_distance(p, (0,0)) == r]
-        occupied_cells = {p for p, _ in self.preys}
-        available_cells = [p for p in launch_ring_cells if p not in occupied_cells]
-        if available_cells:
-            pos = random.choice(available_cells)
-            self.preys.append((pos, 10.0))
-
-    # Initiates a New Sim w/ Params b.o Slider Values.
+    # Initiates a New Sim w/ Params b.o Slider Values -> UI Attaches as an Observer of the Engine.
+    # A Previous Run that Ended on its Own is Closed Out First (Detached & its Profile Written).
     def start_sim(self):
         if self.sim_running: return
-        
-        controls = self.controls.sliders
-        n_for = int(controls["Forager %"].value)
-        n_rec = int(controls["Primary Receiver %"].value)
-        max_bouts = int(controls["Max Bouts"].value)
-        food_scarcity = controls["Food Scarcity"].value
-        n_fed = n_rec // 2 if n_rec > 0 else 10 
-
-        self.model = WaspModel(
-            self,
-            n_for=n_for,
-            n_rec=n_rec,
-            n_fed=n_fed,
-            max_bouts=max_bouts,
-            food_scarcity=food_scarcity
-        )
+        self.stop_sim()
+
+        self.model = WaspModel(self.controls.get_params())
+        self.model.add_observer(self)
+        if self.profile_path:
+            self.model.enable_profiling()
         self.renderer.model = self.model
-        self.grid = self.model.ui.grid
-        self.agents = self.model.ui_agents 
+        self.grid = self.model.nest_grid
+        self.agents = self.model.ui_agents
+        self.preys = self.model.preys
+        self.scheduler.reset(self.model)
         self.sim_running = True
-        self.preys.clear()
-        self.spawn_prey()
-        self.prey_respawn_timer = 0.0
-        self.last_realtime_check = pygame.time.get_ticks()
-        self.model.start_new_bout(self.last_realtime_check)
+
+    # Plays a Trajectory File through the Same Renderer (No Agent Logic Runs) -> Seek w/ Keys or the Scrub Bar.
+    def start_replay(self, path):
+        self.stop_sim()
+        self.model = TrajectoryReplay(path)
+        self.model.add_observer(self)
+        self.renderer.model = self.model
+        self.grid = self.model.nest_grid
+        self.agents = self.model.ui_agents
+        self.preys = self.model.preys
+        self.scheduler.reset(self.model)
+        self.sim_running = True
+        self.replaying = True
+        self.metrics_dirty = True
+
+    # Jump to a Replay Frame (Interpolation is Dropped so Agents Never Slide Across a Seek).
+    def seek_replay(self, frame):
+        if not self.replaying: return
+        self.model.seek(frame)
+        self.scheduler.drop_interpolation()
+
+    # Scrub Bar X Position -> Replay Frame.
+    def scrub_to(self, x):
+        frac = (x - self.scrub_rect.x) / self.scrub_rect.width
+        self.seek_replay(round(max(0.0, min(1.0, frac)) * (len(self.model.reader) - 1)))
 
     # Stops Simulation Run & Resets State.
     def stop_sim(self):
+        if self.model:
+            self.model.remove_observer(self)
+            self.dump_profile()
         self.sim_running = False
+        self.replaying = False
+        self.scrubbing = False
+        self.hover_pos = None
         self.grid = None
         self.agents = []
+        self.preys = []
         self.model = None
+        self.renderer.model = None
+
+    # Engine Observer Callback -> Flag Metrics for the Next Frame & Stop Once Engine Finishes (Replays Stay Seekable).
+    def on_step(self, model):
+        if not model.running and not self.replaying:
+            self.sim_running = False
+        self.metrics_dirty = True
+
+    # Charge Time Since t to a Profiler Phase (Only while the Model is Profiled).
+    def profile(self, phase, t):
+        profiler = getattr(self.model, "profiler", None)
+        if profiler is not None:
+            profiler.record(phase, time.perf_counter() - t)
 
-    # Calculate & Update Metric Display Chips.
+    # Write the Current Run's Profile Report (if Profiling).
+    def dump_profile(self):
+        profiler = getattr(self.model, "profiler", None)
+        if profiler is not None and self.profile_path:
+            profiler.dump(self.profile_path)
+            print(f"Profile Written to {self.profile_path}")
+
+    # Update Metric Display Chips from the Model's O(1) Metrics Snapshot.
     def update_metrics(self):
         if not self.grid or not self.model: 
             for m in self.metrics: m.value = "—"
             return
         
-        larvae = [c for c in self.grid.cells.values() if c.type == "larva"]
-        total = len(larvae)
-        
+        snap = self.model.metrics.snapshot()
+
         # Metric 01: Route Efficiency
-        total_steps = self.model.current_bout_steps
-        larvae_fed = self.model.current_bout_larvae_fed
-        efficiency = (larvae_fed / total_steps) * 100 if total_steps else 0
-        self.metrics[0].value = f"{efficiency:.2f}"
+        self.metrics[0].value = f"{snap['route_efficiency']:.2f}"
 
         # Metric 02: Unfed Larvae %
-        unfed = sum(1 for c in larvae if c.hunger > 0.1)
-        self.metrics[1].value = f"{(unfed/total * 100 if total else 0):.1f}%"
+        self.metrics[1].value = f"{snap['unfed_pct']:.1f}%"
         
         # Metric 03: L1:L2:L3 Larval Stage Ratio %
-        larvae_data = {'larva1': 0, 'larva2': 0, 'larva3': 0}
-        total_larvae_in_ratio = 0
-        
-        for cell in self.grid.cells.values():
-            if cell.type == "larva":
-                stage = cell.stage
-                if stage in larvae_data:
-                    larvae_data[stage] += 1
-                total_larvae_in_ratio += 1
-        
-        if total_larvae_in_ratio > 0:
-            l1_pc = (larvae_data.get('larva1', 0) / total_larvae_in_ratio) * 100
-            l2_pc = (larvae_data.get('larva2', 0) / total_larvae_in_ratio) * 100
-            l3_pc = (larvae_data.get('larva3', 0) / total_larvae_in_ratio) * 100
-            
-            raw_percentages = [l1_pc, l2_pc, l3_pc]
-            rounded_percentages = [int(p) for p in raw_percentages]
-            error = 100 - sum(rounded_percentages)
-            fractions = [p - int(p) for p in raw_percentages]
-            sorted_fractions = sorted([(f, i) for i, f in enumerate(fractions)], reverse = True)
-            
-            for i in range(error):
-                original_index = sorted_fractions[i][1]
-                rounded_percentages[original_index] += 1
-                
-            l_ratio = f"{rounded_percentages[0]}:{rounded_percentages[1]}:{rounded_percentages[2]}"
-        else:
-            l_ratio = "0:0:0"
-
-        self.metrics[2].value = l_ratio
+        self.metrics[2].value = ":".join(str(p) for p in snap['l_ratio'])
         
         # Metric 04: Bout Count
         self.metrics[3].label = "Bout Count"
-        self.metrics[3].value = str(self.model.bout_count)
+        self.metrics[3].value = str(snap['bout_count'])
 
         # Metric 05: Hungry Receivers
-        hungry_receivers = sum(1 for a in self.agents if a.agent_type == "primary_receiver" and a.load < 0.1)
-        self.metrics[4].value = str(hungry_receivers)
+        self.metrics[4].value = str(snap['hungry_receivers'])
         
         # Metric 06: Radial Bias
-        foragers_total = 0
-        periphery_radius = self.grid.visible_radius + 1 
-        foragers_on_periphery = 0
-        
-        for agent in self.agents:
-            if agent.agent_type == "forager":
-                foragers_total += 1
-                if hex_distance(agent.pos, (0, 0)) == periphery_radius: 
-                    foragers_on_periphery += 1
-        
-        radial_bias = (foragers_on_periphery / foragers_total) * 100 if foragers_total > 0 else 0.0
-        self.metrics[5].value = f"{radial_bias:.1f}%"
+        self.metrics[5].value = f"{snap['radial_bias']:.1f}%"
+
+    # Hover Text for the Hex Under the Cursor (Renderer Caches it, so Calling this Every Frame is O(1)).
+    def update_hover(self):
+        if self.sim_running and self.hover_pos is not None:
+            self.hover_info = self.renderer.get_hover_info(self.hover_pos, self.grid)
 
-    # Draw all UI Components Onscreen.
+    # Screen Area a Titled Panel Occupies (Title Text Sits Across the Top Border).
+    def panel_area(self, rect):
+        half_title = self.font.get_height() // 2 + 1
+        return pygame.Rect(rect.x, rect.y - half_title, rect.width + 1, rect.height + half_title + 2)
+
+    # (Name, Screen Area, State, Draw Function) per Panel -> a Panel is Redrawn Only when its State Changes.
+    def panels(self):
+        # Playground Only Changes w/ what it Draws: Model & Step, Interpolation, View & the Overlay's Latest Refresh.
+        model, renderer = self.model, self.renderer
+        playground_state = (
+            model, self.grid, model and model.steps, self.scheduler.alpha, self.scheduler.paused,
+            renderer.zoom, renderer.offset_x, renderer.offset_y, self.overlay.generation,
+        )
+        controls_state = (
+            self.scroll_y,
+            tuple(s.value for s in self.controls.sliders.values()),
+            tuple((d.selected, d.is_open) for d in self.controls.dropdowns.values()),
+        )
+        panels = [
+            ("playground", self.panel_area(self.playground_rect), playground_state, self.draw_playground),
+            ("status", self.panel_area(self.top_bar_rect), self.status_texts(), self.draw_status),
+            ("metrics", self.panel_area(self.metrics_rect), tuple((m.label, m.value) for m in self.metrics), self.draw_metrics),
+            ("hover", self.panel_area(self.hover_rect), self.hover_info, self.draw_hover),
+            ("params", self.panel_area(self.params_rect), controls_state, self.draw_params),
+        ]
+        for i, btn in enumerate(self.buttons):
+            panels.append((f"button{i}", btn.rect, btn.current_color, lambda b = btn: b.draw(self.screen)))
+        return panels
+
+    # Draw all UI Components Onscreen -> Unchanged Panels are Skipped & Only Dirty Rects are Pushed to the Display.
     def draw(self):
-        self.screen.fill(self.bg_color)
-        
-        # Draw PLAYGROUND & Nest Grid
+        # Overlay Counts Every Frame (Even when the Playground is Skipped) & Re-Renders on its Own Cadence.
+        self.overlay.tick(self.model)
+        full = self.full_redraw
+        if full:
+            self.screen.fill(self.bg_color)
+            self.panel_states.clear()
+
+        dirty = []
+        for name, area, state, draw_panel in self.panels():
+            if not full and name in self.panel_states and self.panel_states[name] == state:
+                continue
+            self.panel_states[name] = state
+            if not full:
+                self.screen.fill(self.bg_color, area)
+            draw_panel()
+            dirty.append(area)
+
+        # Recording Copies the Playground into the Encoder Queue (Never Blocks the Frame).
+        if self.recording:
+            self.recorder.capture(self.screen, self.playground_rect)
+
+        t = time.perf_counter()
+        if full:
+            pygame.display.flip()
+            self.full_redraw = False
+        elif dirty:
+            pygame.display.update(dirty)
+        self.overlay.record("flip", t)
+
+    # Draw PLAYGROUND, Nest Grid & LEGEND
+    def draw_playground(self):
         self.draw_titled_border(self.screen, self.playground_rect, "PLAYGROUND")
         inner = self.playground_rect.inflate(-self.margin * 2, -self.margin * 2)
         pygame.draw.rect(self.screen, self.border_color, inner, 1)
@@ -293,12 +359,18 @@ class WaspSimUI:
         old_clip = self.screen.get_clip()
         self.screen.set_clip(inner)
         if self.grid:
+            t = time.perf_counter()
             self.renderer.draw_grid(self.screen, self.grid)
+            self.overlay.record("grid", t)
+            t = time.perf_counter()
             self.renderer.draw_preys(self.screen, self.preys) 
             self.renderer.draw_agents(self.screen, self.agents)
+            self.overlay.record("agents", t)
+        if self.replaying:
+            self.draw_scrubber()
+        self.overlay.draw(self.screen, inner)
         self.screen.set_clip(old_clip)
 
-        # Draw LEGEND
         pygame.draw.rect(self.screen, UI_COLORS["panel_bg"], self.legend_rect)
         self.draw_titled_border(self.screen, self.legend_rect, "LEGEND")
         lx, ly = self.legend_rect.x + 15, self.legend_rect.y + 15
@@ -311,55 +383,78 @@ class WaspSimUI:
         for lbl, col in items:
             pygame.draw.rect(self.screen, col, (lx, ly, 20, 20))
             pygame.draw.rect(self.screen, UI_COLORS["border"], (lx, ly, 20, 20), 1)
-            self.screen.blit(self.small_font.render(lbl, True, UI_COLORS["text"]), (lx + 30, ly + 2))
+            self.screen.blit(TextCache.render(self.small_font, lbl, UI_COLORS["text"]), (lx + 30, ly + 2))
             ly += 25
 
-        # Draw STATUS
-        self.draw_titled_border(self.screen, self.top_bar_rect, "STATUS")
-        
+    # Draw Replay SCRUB Bar: Played Fraction, Frame Counter & Simulated Time.
+    def draw_scrubber(self):
+        rect = self.scrub_rect
+        last = max(1, len(self.model.reader) - 1)
+        played = rect.copy()
+        played.width = int(rect.width * self.model.frame / last)
+        pygame.draw.rect(self.screen, UI_COLORS["panel_bg"], rect)
+        pygame.draw.rect(self.screen, UI_COLORS["highlight"], played)
+        pygame.draw.rect(self.screen, self.border_color, rect, 1)
+        secs = self.model.now_ms // 1000
+        label = f"REPLAY {self.model.frame}/{last} · {secs // 60:02d}:{secs % 60:02d}"
+        label_surf = TextCache.render(self.small_font, label, self.text_color)
+        self.screen.blit(label_surf, label_surf.get_rect(center = rect.center))
+
+    # STATUS Bar Strings: Recording Timer, UTC Clock, Sim Speed.
+    def status_texts(self):
         if self.recording and self.start_time:
             dur = (pygame.time.get_ticks() - self.start_time) // 1000
             rec_text = f"REC {dur//3600:02d}:{(dur%3600)//60:02d}:{dur%60:02d}"
+        elif self.recorder.finishing:
+            rec_text = "SAVING RECORDING..."
         else:
             rec_text = "RECORDING: OFF"
-        rec_surf = self.font.render(rec_text, True, self.rec_color if self.recording else self.text_color)
+        utc = datetime.datetime.now(datetime.timezone.utc).strftime("%H:%M:%S UTC")
+        return rec_text, utc, f"SPEED {self.scheduler.speed_label}", self.recording
+
+    # Draw STATUS
+    def draw_status(self):
+        self.draw_titled_border(self.screen, self.top_bar_rect, "STATUS")
+        rec_text, utc, speed_text, recording = self.status_texts()
+
+        rec_surf = TextCache.render(self.font, rec_text, self.rec_color if recording else self.text_color)
         self.screen.blit(rec_surf, (self.top_bar_rect.x + 15, self.top_bar_rect.y + 8))
         
-        utc = datetime.datetime.now(datetime.timezone.utc).strftime("%H:%M:%S UTC")
-        utc_surf = self.font.render(utc, True, self.text_color)
+        utc_surf = TextCache.render(self.font, utc, self.text_color)
         self.screen.blit(utc_surf, (self.top_bar_rect.right - utc_surf.get_width() - 15, self.top_bar_rect.y + 8))
 
-        # Draw METRICS
+        speed_surf = TextCache.render(self.font, speed_text, self.text_color)
+        self.screen.blit(speed_surf, (self.top_bar_rect.centerx - speed_surf.get_width() // 2, self.top_bar_rect.y + 8))
+
+    # Draw METRICS
+    def draw_metrics(self):
         self.draw_titled_border(self.screen, self.metrics_rect, "METRICS")
         for m in self.metrics: m.draw(self.screen)
         
-        # Draw HOVERSTATE
+    # Draw HOVERSTATE (Clipped so Long Agent Lists Never Spill into PARAMETERS).
+    def draw_hover(self):
         self.draw_titled_border(self.screen, self.hover_rect, "HOVERSTATE")
         if self.hover_info:
+            old_clip = self.screen.get_clip()
+            self.screen.set_clip(self.hover_rect.inflate(-2, -2))
             lines = self.hover_info.split('\n')
             for i, l in enumerate(lines):
-                self.screen.blit(self.small_font.render(l, True, (255, 255, 200)), (self.hover_rect.x + 10, self.hover_rect.y + 10 + i * 15))
+                self.screen.blit(TextCache.render(self.small_font, l, (255, 255, 200)), (self.hover_rect.x + 10, self.hover_rect.y + 10 + i * 15))
+            self.screen.set_clip(old_clip)
 
-        # Draw PARAMETERS
+    # Draw PARAMETERS
+    def draw_params(self):
         self.draw_titled_border(self.screen, self.params_rect, "PARAMETERS")
         old_clip = self.screen.get_clip()
         self.screen.set_clip(self.params_rect.inflate(-5, -5))
         self.controls.draw(self.screen, self.scroll_y)
         self.screen.set_clip(old_clip)
 
-        # Draw Buttons.
-        self.start_rec_btn.draw(self.screen)
-        self.stop_rec_btn.draw(self.screen)
-        self.start_sim_btn.draw(self.screen)
-        self.stop_sim_btn.draw(self.screen)
-        self.exit_btn.draw(self.screen)
-
-        pygame.display.flip()
-
     # Pygame Event Processing.
     def handle_events(self):
         for e in pygame.event.get():
             if e.type == pygame.QUIT: return False
+            if e.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED): self.full_redraw = True
             
             if self.start_rec_btn.handle_event(e): self.start_recording()
             if self.stop_rec_btn.handle_event(e): self.stop_recording()
@@ -367,53 +462,79 @@ class WaspSimUI:
             if self.stop_sim_btn.handle_event(e): self.stop_sim()
             if self.exit_btn.handle_event(e): return False
             
+            # Replay Scrubbing: Click or Drag Along the Scrub Bar.
+            if self.replaying:
+                if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and self.scrub_rect.collidepoint(e.pos):
+                    self.scrubbing = True
+                    self.scrub_to(e.pos[0])
+                elif e.type == pygame.MOUSEMOTION and self.scrubbing:
+                    self.scrub_to(e.pos[0])
+                elif e.type == pygame.MOUSEBUTTONUP:
+                    self.scrubbing = False
+
             if e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
                 adj_e = pygame.event.Event(e.type, {'pos': (e.pos[0], e.pos[1] + self.scroll_y), 'button': getattr(e,'button',1)})
                 if self.params_rect.collidepoint(e.pos):
                     self.controls.handle_event(adj_e, self.scroll_y) 
             
+            # Speed Control: SPACE Pause, RIGHT Single-Step, UP/DOWN Faster/Slower, 1-4 Pick Speed; F3 Toggles the Perf Overlay.
+            if e.type == pygame.KEYDOWN:
+                if e.key == pygame.K_F3: self.overlay.toggle()
+                if e.key == pygame.K_SPACE: self.scheduler.toggle_pause()
+                elif e.key == pygame.K_RIGHT: self.scheduler.single_step()
+                elif e.key == pygame.K_UP: self.scheduler.faster()
+                elif e.key == pygame.K_DOWN: self.scheduler.slower()
+                elif pygame.K_1 <= e.key <= pygame.K_4: self.scheduler.set_speed(e.key - pygame.K_1)
+
+                # Replay Seeking: LEFT Step Back, PGUP/PGDN Jump 10%, HOME/END First/Last Frame.
+                if self.replaying:
+                    jump = max(1, len(self.model.reader) // 10)
+                    if e.key == pygame.K_LEFT:
+                        self.scheduler.paused = True
+                        self.seek_replay(self.model.frame - 1)
+                    elif e.key == pygame.K_PAGEUP: self.seek_replay(self.model.frame - jump)
+                    elif e.key == pygame.K_PAGEDOWN: self.seek_replay(self.model.frame + jump)
+                    elif e.key == pygame.K_HOME: self.seek_replay(0)
+                    elif e.key == pygame.K_END: self.seek_replay(len(self.model.reader) - 1)
+
             if e.type == pygame.MOUSEWHEEL and self.params_rect.collidepoint(pygame.mouse.get_pos()):
                 self.scroll_y = max(0, min(self.max_scroll, self.scroll_y - e.y * 20))
 
             if self.sim_running and self.playground_rect.collidepoint(pygame.mouse.get_pos()):
                 if e.type == pygame.MOUSEMOTION:
-                    ax = self.renderer.mouse_to_axial(e.pos)
-                    self.hover_info = self.renderer.get_hover_info(ax, self.grid)
+                    self.hover_pos = self.renderer.mouse_to_axial(e.pos)
+                    self.update_hover()
                 if e.type == pygame.MOUSEBUTTONDOWN:
                     if e.button == 4: self.renderer.zoom_in()
                     if e.button == 5: self.renderer.zoom_out()
                     
         return True
 
-    # Main Sim & Rendering Loop
+    # Main Sim & Rendering Loop -> Scheduler Runs Due Model Steps, Drawing Stays at Display Rate.
     def run(self):
         clock = pygame.time.Clock()
-        while self.handle_events():
+        dt = 0.0
+        while True:
+            t = time.perf_counter()
+            if not self.handle_events(): break
+            self.overlay.record("events", t)
             if self.sim_running and self.model:
-                now = pygame.time.get_ticks()
-                dt = (now - self.last_realtime_check) / 1000.0 
-                
-                # Prey Respawn Logic
-                self.prey_respawn_timer += dt
-                if self.prey_respawn_timer > self.prey_respawn_interval and len(self.preys) < self.max_prey_on_map: 
-                    self.spawn_prey()
-                    self.prey_respawn_timer = 0.0
-                    
-                # Hunger Decay Logic
-                if self.grid:
-                    self.grid.decay_hunger(dt)
-                    for agent in self.model.ui_agents:
-                        if hasattr(agent, 'decay_hunger'):
-                            agent.decay_hunger(dt)
-                            
-                self.last_realtime_check = now
-                self.model.check_bout_end_time(now)
-                self.model.step()
-                
-                # Slowing Down Sim Update Rate -> Wait 200ms betn. Model Steps (~5steps/s)
-                pygame.time.wait(200) 
-                self.update_metrics()
+                t = time.perf_counter()
+                self.scheduler.update(self.model, dt)
+                self.overlay.record("step", t)
+                if self.metrics_dirty:
+                    t = time.perf_counter()
+                    self.update_metrics()
+                    self.update_hover()
+                    self.metrics_dirty = False
+                    self.overlay.record("metrics", t)
+                    self.profile("metrics", t)
             
+            t = time.perf_counter()
             self.draw()
-            clock.tick(60)
+            self.profile("draw", t)
+            dt = clock.tick(60) / 1000.0
+        self.recorder.stop()
+        self.recorder.wait()
+        self.dump_profile()
         pygame.quit()
\ No newline at end of file
@@ -0,0 +1,183 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from types import SimpleNamespace
+import numpy as np
+from src.model.params import SimParams
+from src.model.wasp_model import WaspModel
+
+# Prey Density Levels -> (max_prey_on_map, prey_respawn_interval).
+PREY_LEVELS = {"sparse": (3, 5.0), "dense": (12, 1.0)}
+
+DEFAULT_RADII = [2, 4, 6, 8, 12]
+DEFAULT_COLONIES = ["5,10,5", "20,40,20", "80,160,80"]
+
+# Offscreen Frame Size (Roughly the Playground of a 1080p Window).
+FRAME_SIZE = (1300, 1000)
+
+# Metrics Compared Against a Baseline -> (Higher is Better, Threshold Multiplier, Minimum Absolute Change).
+# Throughput & Medians Hold Steady Run to Run; Tails Swing w/ Scheduler Noise, so they Get a Wider Margin & a Floor.
+COMPARED = {
+    "steps_per_sec": (True, 1.0, 0.0),
+    "step_us_p50": (False, 1.0, 2.0),
+    "render_ms_p50": (False, 1.0, 0.2),
+    "step_us_p99": (False, 3.0, 50.0),
+    "render_ms_p99": (False, 3.0, 1.0),
+}
+
+# 1 Benchmark Case per (Radius, Colony, Prey Level) Combination.
+def build_cases(radii, colonies, prey_levels):
+    cases = []
+    for radius, colony, prey in itertools.product(radii, colonies, prey_levels):
+        n_for, n_rec, n_fed = (int(n) for n in colony.split(","))
+        max_prey, respawn = PREY_LEVELS[prey]
+        cases.append({
+            "case": f"r{radius}_c{n_for}-{n_rec}-{n_fed}_{prey}",
+            "params": SimParams(
+                nest_radius = radius, n_for = n_for, n_rec = n_rec, n_fed = n_fed, max_bouts = 10**9,
+                max_prey_on_map = max_prey, prey_respawn_interval = respawn, seed = 0,
+            ),
+        })
+    return cases
+
+# Step Latency Distribution (Microseconds) & Throughput after a Warm-Up.
+def bench_steps(params, steps, warmup):
+    model = WaspModel(params)
+    for _ in range(warmup):
+        model.step()
+    lat = np.empty(steps, dtype = np.int64)
+    clock = time.perf_counter_ns
+    for i in range(steps):
+        t = clock()
+        model.step()
+        lat[i] = clock() - t
+    us = lat / 1000.0
+    return model, {
+        "steps_per_sec": round(steps / (lat.sum() / 1e9), 1),
+        "step_us_p50": round(float(np.percentile(us, 50)), 2),
+        "step_us_p90": round(float(np.percentile(us, 90)), 2),
+        "step_us_p99": round(float(np.percentile(us, 99)), 2),
+        "step_us_max": round(float(us.max()), 2),
+    }
+
+# Offscreen HexRenderer Frame Time (Nest + Prey + Agents) at 1 Zoom; the Model Steps Between Frames (Untimed).
+def bench_render(model, frames, zoom):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    from src.ui.mesa_visualizer import HexRenderer
+    from src.ui.scheduler import StepScheduler
+
+    surface = pygame.Surface(FRAME_SIZE)
+    ui = SimpleNamespace(model = model, scheduler = StepScheduler())
+    renderer = HexRenderer(surface.get_rect(), 0, ui)
+    renderer.model = model
+    renderer.zoom = zoom
+
+    times = np.empty(frames)
+    for i in range(frames + 1):
+        t = time.perf_counter()
+        renderer.draw_grid(surface, model.nest_grid)
+        renderer.draw_preys(surface, model.preys)
+        renderer.draw_agents(surface, model.ui_agents)
+        # Frame 0 Builds the Cached Nest Layer -> Reported Separately.
+        if i == 0:
+            first = time.perf_counter() - t
+        else:
+            times[i - 1] = time.perf_counter() - t
+        ui.scheduler._step(model)
+    ms = times * 1000.0
+    return {
+        "render_ms_first": round(first * 1000.0, 3),
+        "render_ms_p50": round(float(np.percentile(ms, 50)), 3),
+        "render_ms_p99": round(float(np.percentile(ms, 99)), 3),
+    }
+
+# Per-Metric Median over Repeated Runs -> 1 Unlucky Run Can't Move a Reported Value.
+def median_stats(runs):
+    return {key: round(float(np.median([run[key] for run in runs])), 3) for key in runs[0]}
+
+# `repeats` Runs per Case, Reported as Per-Metric Medians.
+def run_benchmarks(cases, steps, warmup, frames, zoom, repeats = 3, log = print):
+    results = []
+    for case in cases:
+        step_runs, render_runs = [], []
+        for _ in range(repeats):
+            model, stats = bench_steps(case["params"], steps, warmup)
+            step_runs.append(stats)
+            if frames:
+                render_runs.append(bench_render(model, frames, zoom))
+        row = {"case": case["case"], "cells": len(model.nest_grid.cells), "agents": len(model.ui_agents), **median_stats(step_runs)}
+        if render_runs:
+            row.update(median_stats(render_runs))
+        log(format_row(row))
+        results.append(row)
+    return results
+
+def format_row(row):
+    render = f"  render p50 {row['render_ms_p50']:8.3f} ms" if "render_ms_p50" in row else ""
+    return (f"{row['case']:<28} {row['steps_per_sec']:>10.1f} steps/s  "
+            f"p50 {row['step_us_p50']:>9.1f} us  p99 {row['step_us_p99']:>9.1f} us{render}")
+
+# Cases whose Compared Metrics Moved the Wrong Way by More than threshold (Fraction of Baseline, Scaled per Metric)
+# & by More than the Metric's Absolute Floor.
+def compare(results, baseline, threshold):
+    base = {row["case"]: row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        old = base.get(row["case"])
+        if old is None: continue
+        for metric, (higher_is_better, scale, min_delta) in COMPARED.items():
+            if metric not in row or metric not in old or not old[metric]: continue
+            delta = row[metric] - old[metric]
+            worse = -delta if higher_is_better else delta
+            if worse > min_delta and worse / old[metric] > threshold * scale:
+                regressions.append({"case": row["case"], "metric": metric, "baseline": old[metric], "current": row[metric], "change": round(delta / old[metric], 4)})
+    return regressions
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "ARM Model Step & Render Benchmarks.")
+    parser.add_argument("--radius", type = int, nargs = "+", default = DEFAULT_RADII)
+    parser.add_argument("--colony", nargs = "+", default = DEFAULT_COLONIES, help = "Agent Counts as n_for,n_rec,n_fed.")
+    parser.add_argument("--prey", nargs = "+", default = list(PREY_LEVELS), choices = list(PREY_LEVELS))
+    parser.add_argument("--steps", type = int, default = 500)
+    parser.add_argument("--warmup", type = int, default = 50)
+    parser.add_argument("--frames", type = int, default = 60, help = "Offscreen Frames per Case (0 Skips Rendering).")
+    parser.add_argument("--zoom", type = float, default = 1.0)
+    parser.add_argument("--repeats", type = int, default = 3, help = "Runs per Case (Median is Kept).")
+    parser.add_argument("-o", "--out", default = "benchmark.json")
+    parser.add_argument("--baseline", help = "Earlier Results File -> Flag Regressions Against it.")
+    parser.add_argument("--threshold", type = float, default = 0.10, help = "Allowed Slowdown Fraction Before a Regression (Tail Percentiles Allow 3x).")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.radius, args.colony, args.prey)
+    results = run_benchmarks(cases, args.steps, args.warmup, args.frames, args.zoom, args.repeats)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "steps": args.steps, "warmup": args.warmup, "frames": args.frames, "zoom": args.zoom, "repeats": args.repeats,
+        },
+        "results": results,
+    }
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for r in regressions:
+            print(f"REGRESSION {r['case']} {r['metric']}: {r['baseline']} -> {r['current']} ({r['change']:+.1%})")
+        print(f"{len(regressions)} Regression(s) vs {args.baseline} (Threshold {args.threshold:.0%})")
+
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent = 2)
+    print(f"{len(results)} Cases Written to {args.out}")
+    return 1 if report.get("regressions") else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
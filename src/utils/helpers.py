@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 # NEST Cell Color Palette
 COLORS = {
@@ -9,6 +10,7 @@ COLORS = {
     "larva2": (255, 225, 140), # Warm Yellow
     "larva3": (255, 190, 80), # Golden Yellow
     "pupa": (230, 210, 170), # Light Tan
+    "hungry": (200, 40, 30), # Starving Red (Low-Zoom Heatmap)
 }
 
 # Agent Role & Behaviour Color Palatte
@@ -32,6 +34,57 @@ UI_COLORS = {
     "error": (255, 0, 0), # Pure Red
 }
 
+# Axial Neighbour Directions
+HEX_DIRECTIONS = [(1,0), (1,-1), (0,-1), (-1,0), (-1,1), (0,1)]
+
 # Grid Calculation
 def hex_distance(a, b):
-    return (abs(a[0] - b[0]) + abs(a[1] - b[1]) + abs(a[0] - b[0] + a[1] - b[1])) // 2
\ No newline at end of file
+    return (abs(a[0] - b[0]) + abs(a[1] - b[1]) + abs(a[0] - b[0] + a[1] - b[1])) // 2
+
+# Batched hex_distance: 1 Origin -> Many Hexes Given as q & r Arrays.
+def hex_distances(origin, q, r):
+    dq = np.subtract(q, origin[0])
+    dr = np.subtract(r, origin[1])
+    return (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+
+# Pairwise Distances, Shape (len(a_q), len(b_q)).
+def hex_distance_matrix(a_q, a_r, b_q, b_r):
+    dq = np.subtract.outer(a_q, b_q)
+    dr = np.subtract.outer(a_r, b_r)
+    return (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+
+# Hexes Allowed by mask & within radius of origin (None = No Limit) -> Candidate Indices (None = All) & Distances.
+def _hex_candidates(origin, q, r, radius, mask):
+    dist = hex_distances(origin, q, r)
+    allowed = None if mask is None else np.asarray(mask, dtype = bool)
+    if radius is not None:
+        allowed = dist <= radius if allowed is None else allowed & (dist <= radius)
+    return (None if allowed is None else np.flatnonzero(allowed)), dist
+
+# Index of the Smallest values Entry (values None -> Nearest Hex) among Candidates; Ties -> Lowest Index; -1 if None.
+def hex_argmin(origin, q, r, values = None, radius = None, mask = None):
+    cand, dist = _hex_candidates(origin, q, r, radius, mask)
+    key = dist if values is None else np.asarray(values)
+    if cand is None:
+        return int(key.argmin()) if len(key) else -1
+    return int(cand[key[cand].argmin()]) if len(cand) else -1
+
+# Index of the Largest values Entry (values None -> Farthest Hex) among Candidates; Ties -> Lowest Index; -1 if None.
+def hex_argmax(origin, q, r, values = None, radius = None, mask = None):
+    cand, dist = _hex_candidates(origin, q, r, radius, mask)
+    key = dist if values is None else np.asarray(values)
+    if cand is None:
+        return int(key.argmax()) if len(key) else -1
+    return int(cand[key[cand].argmax()]) if len(cand) else -1
+
+# All Hex CoOrds Exactly k Steps from Center (k = 0 -> Center Only).
+def hex_ring(center, k):
+    if k == 0:
+        return [center]
+    ring = []
+    q, r = center[0] + HEX_DIRECTIONS[4][0] * k, center[1] + HEX_DIRECTIONS[4][1] * k
+    for dq, dr in HEX_DIRECTIONS:
+        for _ in range(k):
+            ring.append((q, r))
+            q, r = q + dq, r + dr
+    return ring
\ No newline at end of file